@@ -1,14 +1,29 @@
 import json
 import google.generativeai as genai
+from collections import OrderedDict
 from pathlib import Path
+from threading import Lock
 import time
 
+class GeminiGenerationError(RuntimeError):
+    """Gemini 답변 생성 실패 (generate_answer(raise_on_error=True)에서 발생)"""
+
+
 class GeminiClient:
     """Gemini API 클라이언트"""
     
-    def __init__(self, credentials_path: Path):
-        """Gemini API 클라이언트 초기화"""
+    def __init__(self, credentials_path: Path, cache_size: int = 0):
+        """
+        Gemini API 클라이언트 초기화
+        
+        Args:
+            credentials_path: API 키 파일 경로
+            cache_size: 같은 프롬프트의 답변을 메모리에 보관할 최대 개수 (0이면 캐시 사용 안 함)
+        """
         self.credentials_path = credentials_path
+        self.cache_size = cache_size
+        self._answer_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_lock = Lock()
         self._load_credentials()
         self._setup_client()
     
@@ -30,21 +45,57 @@ class GeminiClient:
         genai.configure(api_key=self.api_key)
         self.model = genai.GenerativeModel('gemini-1.5-flash')
     
-    def generate_answer(self, prompt: str, max_retries: int = 3) -> str:
-        """답변 생성"""
+    def generate_answer(self, prompt: str, max_retries: int = 3, raise_on_error: bool = False) -> str:
+        """
+        답변 생성 (cache_size > 0이면 같은 프롬프트는 API 호출 없이 이전 답변 반환)
+        
+        Args:
+            prompt: 프롬프트
+            max_retries: 최대 시도 횟수
+            raise_on_error: True면 실패 시 안내 문구 대신 GeminiGenerationError 발생
+                            (응답을 그대로 파싱/저장하는 호출자가 실패를 구분할 수 있도록)
+        """
+        if self.cache_size > 0:
+            with self._cache_lock:
+                cached = self._answer_cache.get(prompt)
+                if cached is not None:
+                    self._answer_cache.move_to_end(prompt)
+                    return cached
+        
         for attempt in range(max_retries):
             try:
                 response = self.model.generate_content(prompt)
                 if response.text:
-                    return response.text.strip()
+                    answer = response.text.strip()
+                    self._store_cached_answer(prompt, answer)
+                    return answer
                 else:
+                    if raise_on_error:
+                        raise GeminiGenerationError("Gemini 응답이 비어 있습니다.")
                     return "답변을 생성할 수 없습니다."
+            except GeminiGenerationError:
+                raise
             except Exception as e:
                 if attempt < max_retries - 1:
                     print(f"   ⚠️  Gemini API 호출 실패 (시도 {attempt + 1}/{max_retries}): {e}")
                     time.sleep(2)  # 재시도 전 대기
                 else:
                     print(f"   ❌ Gemini API 호출 최종 실패: {e}")
+                    if raise_on_error:
+                        raise GeminiGenerationError(f"Gemini API 호출 실패: {e}") from e
                     return f"API 호출 중 오류가 발생했습니다: {str(e)}"
         
-        return "답변을 생성할 수 없습니다." 
\ No newline at end of file
+        if raise_on_error:
+            raise GeminiGenerationError("Gemini 답변을 생성하지 못했습니다.")
+        return "답변을 생성할 수 없습니다."
+    
+    def _store_cached_answer(self, prompt: str, answer: str):
+        """성공한 답변만 캐시에 저장 (오류 메시지는 저장하지 않음)"""
+        if self.cache_size <= 0:
+            return
+        
+        with self._cache_lock:
+            self._answer_cache[prompt] = answer
+            self._answer_cache.move_to_end(prompt)
+            while len(self._answer_cache) > self.cache_size:
+                self._answer_cache.popitem(last=False)
@@ -5,13 +5,29 @@ RAG 파이프라인 모듈 패키지
 - 쉬운 유지보수 및 확장
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 from .config import *
-from .document_manager import DocumentManager
-from .search_engine import FlexibleSearchEngine
-from .reranking import DocumentReranker
-from .prompting import PromptEngineer
-from .answer_generator import AnswerGenerator
-from .rag_pipeline import RAGPipeline
+
+if TYPE_CHECKING:  # 정적 분석/IDE용 (실행 시에는 아래 __getattr__에서 지연 import)
+    from .document_manager import DocumentManager
+    from .search_engine import FlexibleSearchEngine
+    from .reranking import DocumentReranker
+    from .prompting import PromptEngineer
+    from .answer_generator import AnswerGenerator
+    from .rag_pipeline import RAGPipeline
+
+# 클래스 이름 -> 정의된 하위 모듈
+# (numpy, chromadb, sentence-transformers 등 무거운 의존성은 실제로 클래스를 쓸 때만 import)
+_LAZY_EXPORTS = {
+    'DocumentManager': '.document_manager',
+    'FlexibleSearchEngine': '.search_engine',
+    'DocumentReranker': '.reranking',
+    'PromptEngineer': '.prompting',
+    'AnswerGenerator': '.answer_generator',
+    'RAGPipeline': '.rag_pipeline',
+}
 
 __all__ = [
     'DocumentManager',
@@ -21,3 +37,17 @@ __all__ = [
     'AnswerGenerator',
     'RAGPipeline'
 ]
+
+
+def __getattr__(name):
+    """첫 접근 시 하위 모듈을 import하고 패키지 속성으로 저장 (PEP 562)"""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
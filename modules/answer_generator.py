@@ -5,11 +5,43 @@
 - Fallback 답변 처리
 """
 
+import re
 import time
 from typing import List, Dict, Tuple
 from .config import ANSWER_CONFIG
 from .prompting import PromptEngineer
 
+# 제목에서 찾을 전문 용어 (우선순위 순)
+TITLE_TECHNICAL_TERMS = (
+    'neural network', 'machine learning', 'deep learning', 'artificial intelligence',
+    'algorithm', 'framework', 'methodology', 'approach', 'technique',
+    'sustainability', 'corporate culture', 'management', 'strategy',
+    'mathematics', 'engineering', 'medical', 'clinical'
+)
+
+# 겹치는 위치의 용어도 모두 잡도록 전방 탐색으로 묶은 단일 패턴
+_TITLE_TERM_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(term) for term in sorted(TITLE_TECHNICAL_TERMS, key=len, reverse=True)) + '))'
+)
+# 같은 위치에서 긴 용어에 가려지는 짧은 용어 보완용
+_TITLE_TERM_CONTAINS = {
+    term: [other for other in TITLE_TECHNICAL_TERMS if other != term and other in term]
+    for term in TITLE_TECHNICAL_TERMS
+}
+
+# 답변 검증용 패턴
+_INVALID_ANSWERS = frozenset(['답변을 생성할 수 없습니다', 'error', 'failed', 'cannot generate'])
+# 제거된 메타 설명 문구 (소문자 답변에서 검색)
+_META_PHRASE_RE = re.compile('|'.join(map(re.escape, (
+    '제공된 문서를 바탕으로', '문서 분석을 통한', '참고문헌을 통해',
+    'based on the provided documents', 'document analysis shows', 'according to the references'
+))))
+# 제목 또는 본문 구조 표시
+_STRUCTURE_MARKER_RE = re.compile('|'.join(map(re.escape, (
+    '제목:', 'Title:', '**제목**', '**Title**',
+    '본론:', 'Main Body:', '**본론**', '**Main Body**'
+))))
+
 class AnswerGenerator:
     """답변 생성기"""
     
@@ -80,39 +112,27 @@ class AnswerGenerator:
         Returns:
             품질 검증 결과
         """
-        if not answer or not answer.strip():
+        stripped = answer.strip() if answer else ''
+        if not stripped:
             return False
         
         # 최소 길이 검증
-        if len(answer.strip()) < ANSWER_CONFIG['min_answer_length']:
+        if len(stripped) < ANSWER_CONFIG['min_answer_length']:
             return False
         
         # 기본적인 품질 검증
-        if answer.lower() in ['답변을 생성할 수 없습니다', 'error', 'failed', 'cannot generate']:
+        answer_lower = answer.lower()
+        if answer_lower in _INVALID_ANSWERS:
             return False
         
         # 메타 설명 검증 (제거된 메타 설명이 다시 나타나는지 확인)
-        meta_phrases = [
-            '제공된 문서를 바탕으로', '문서 분석을 통한', '참고문헌을 통해',
-            'based on the provided documents', 'document analysis shows', 'according to the references'
-        ]
-        
-        answer_lower = answer.lower()
-        for phrase in meta_phrases:
-            if phrase in answer_lower:
-                print(f"   ⚠️  메타 설명 감지: {phrase}")
-                return False
-        
-        # 구조 검증 (제목, 본문, 결론 포함 여부)
-        has_title = any(keyword in answer for keyword in ['제목:', 'Title:', '**제목**', '**Title**'])
-        has_body = any(keyword in answer for keyword in ['본론:', 'Main Body:', '**본론**', '**Main Body**'])
-        has_conclusion = any(keyword in answer for keyword in ['결론:', 'Conclusion:', '**결론**', '**Conclusion**'])
-        
-        # 최소한 제목과 본문은 있어야 함
-        if not (has_title or has_body):
+        meta_match = _META_PHRASE_RE.search(answer_lower)
+        if meta_match:
+            print(f"   ⚠️  메타 설명 감지: {meta_match.group()}")
             return False
         
-        return True
+        # 구조 검증: 최소한 제목이나 본문 표시는 있어야 함
+        return _STRUCTURE_MARKER_RE.search(answer) is not None
     
     def _generate_fallback_answer(self, query: str) -> str:
         """
@@ -218,18 +238,21 @@ class AnswerGenerator:
         if title_concepts:
             expanded += f"\n\n핵심 개념: {', '.join(title_concepts)}"
         
+        # 문장 분리와 소문자 변환은 한 번만 수행
+        sentences = self._split_sentences(abstract)
+        
         # 3. 방법론/기술 추출 및 설명
-        methodologies = self._extract_methodologies(abstract)
+        methodologies = self._extract_methodologies(abstract, sentences)
         if methodologies:
             expanded += f"\n\n주요 방법론: {', '.join(methodologies)}"
         
         # 4. 결과/성과 추출
-        results = self._extract_results(abstract)
+        results = self._extract_results(abstract, sentences)
         if results:
             expanded += f"\n\n주요 결과: {', '.join(results)}"
         
         # 5. 응용 분야 추출
-        applications = self._extract_applications(abstract)
+        applications = self._extract_applications(abstract, sentences)
         if applications:
             expanded += f"\n\n응용 분야: {', '.join(applications)}"
         
@@ -237,89 +260,84 @@ class AnswerGenerator:
     
     def _extract_concepts_from_title(self, title: str) -> List[str]:
         """제목에서 핵심 개념 추출"""
-        concepts = []
-        
-        # 전문 용어 패턴 매칭
-        technical_terms = [
-            'neural network', 'machine learning', 'deep learning', 'artificial intelligence',
-            'algorithm', 'framework', 'methodology', 'approach', 'technique',
-            'sustainability', 'corporate culture', 'management', 'strategy',
-            'mathematics', 'engineering', 'medical', 'clinical'
-        ]
-        
+        # 전문 용어 패턴 매칭 (모든 용어를 한 번의 스캔으로 찾음)
         title_lower = title.lower()
-        for term in technical_terms:
-            if term in title_lower:
-                concepts.append(term)
+        matched = set(_TITLE_TERM_RE.findall(title_lower))
+        for term in list(matched):
+            matched.update(_TITLE_TERM_CONTAINS[term])
+        
+        concepts = [term for term in TITLE_TECHNICAL_TERMS if term in matched]
         
         return concepts[:3]  # 상위 3개만
     
-    def _extract_methodologies(self, abstract: str) -> List[str]:
+    def _extract_methodologies(self, abstract: str, sentences: List[Tuple[str, str]] = None) -> List[str]:
         """초록에서 방법론 추출"""
-        methodologies = []
-        
         # 방법론 관련 키워드
-        method_keywords = [
+        method_keywords = (
             'method', 'approach', 'technique', 'algorithm', 'framework',
             'model', 'system', 'procedure', 'strategy', 'methodology'
-        ]
-        
-        sentences = abstract.split('.')
-        for sentence in sentences:
-            sentence_lower = sentence.lower()
-            for keyword in method_keywords:
-                if keyword in sentence_lower:
-                    # 해당 문장에서 핵심 부분 추출
-                    start = max(0, sentence_lower.find(keyword) - 50)
-                    end = min(len(sentence), sentence_lower.find(keyword) + 100)
-                    methodologies.append(sentence[start:end].strip())
-                    break
+        )
         
-        return methodologies[:2]  # 상위 2개만
+        return self._extract_keyword_snippets(abstract, sentences, method_keywords, 50, 100)
     
-    def _extract_results(self, abstract: str) -> List[str]:
+    def _extract_results(self, abstract: str, sentences: List[Tuple[str, str]] = None) -> List[str]:
         """초록에서 결과 추출"""
-        results = []
-        
         # 결과 관련 키워드
-        result_keywords = [
+        result_keywords = (
             'result', 'outcome', 'performance', 'accuracy', 'efficiency',
             'improvement', 'enhancement', 'effectiveness', 'success'
-        ]
-        
-        sentences = abstract.split('.')
-        for sentence in sentences:
-            sentence_lower = sentence.lower()
-            for keyword in result_keywords:
-                if keyword in sentence_lower:
-                    start = max(0, sentence_lower.find(keyword) - 30)
-                    end = min(len(sentence), sentence_lower.find(keyword) + 80)
-                    results.append(sentence[start:end].strip())
-                    break
+        )
         
-        return results[:2]  # 상위 2개만
+        return self._extract_keyword_snippets(abstract, sentences, result_keywords, 30, 80)
     
-    def _extract_applications(self, abstract: str) -> List[str]:
+    def _extract_applications(self, abstract: str, sentences: List[Tuple[str, str]] = None) -> List[str]:
         """초록에서 응용 분야 추출"""
-        applications = []
-        
         # 응용 분야 키워드
-        application_keywords = [
+        application_keywords = (
             'application', 'use', 'implement', 'deploy', 'apply',
             'industry', 'field', 'domain', 'sector', 'area'
-        ]
-        
-        sentences = abstract.split('.')
-        for sentence in sentences:
-            sentence_lower = sentence.lower()
-            for keyword in application_keywords:
-                if keyword in sentence_lower:
-                    start = max(0, sentence_lower.find(keyword) - 40)
-                    end = min(len(sentence), sentence_lower.find(keyword) + 60)
-                    applications.append(sentence[start:end].strip())
+        )
+        
+        return self._extract_keyword_snippets(abstract, sentences, application_keywords, 40, 60)
+    
+    def _split_sentences(self, abstract: str) -> List[Tuple[str, str]]:
+        """초록을 (문장, 소문자 문장) 리스트로 분리"""
+        return [(sentence, sentence.lower()) for sentence in abstract.split('.')]
+    
+    def _extract_keyword_snippets(self, abstract: str, sentences: List[Tuple[str, str]],
+                                  keywords: Tuple[str, ...], before: int, after: int,
+                                  limit: int = 2) -> List[str]:
+        """
+        키워드가 처음 등장하는 문장에서 키워드 주변 구간 추출
+        
+        Args:
+            abstract: 초록
+            sentences: 미리 분리한 (문장, 소문자 문장) 리스트 (없으면 초록에서 분리)
+            keywords: 우선순위 순 키워드
+            before: 키워드 앞쪽으로 포함할 글자 수
+            after: 키워드 위치부터 포함할 글자 수
+            limit: 최대 추출 개수
+            
+        Returns:
+            추출된 구간 리스트 (최대 limit개)
+        """
+        if sentences is None:
+            sentences = self._split_sentences(abstract)
+        
+        snippets = []
+        for sentence, sentence_lower in sentences:
+            for keyword in keywords:
+                position = sentence_lower.find(keyword)
+                if position != -1:
+                    start = max(0, position - before)
+                    end = min(len(sentence), position + after)
+                    snippets.append(sentence[start:end].strip())
                     break
+            
+            if len(snippets) >= limit:
+                break
         
-        return applications[:2]  # 상위 2개만
+        return snippets
     
     def batch_generate_answers(self, questions: List[Tuple[int, str]], 
                              documents_list: List[List[Dict]]) -> List[str]:
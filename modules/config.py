@@ -18,6 +18,8 @@ SEARCH_CONFIG = {
     'max_docs': 100,
     'max_retries': 5,  # 더 많은 재시도
     'api_delay': 0.3,  # 더 빠른 검색
+    'api_burst': 4,    # 쉬고 있던 동안 쌓아 둘 수 있는 요청 수 (토큰 버킷 용량)
+    'api_pool_size': 32,  # ScienceON 세션의 keep-alive 연결 수 (동시 질문 수 × 질문당 동시 검색 수 이상)
     'batch_size': 5,
     'similarity_threshold': 0.01,  # 더 낮은 임계값으로 더 많은 결과
     'emergency_keywords': ['연구', '분석', '방법', '시스템', '기술', '개발', '최적화', '평가', '관리', '구현'],
@@ -26,7 +28,14 @@ SEARCH_CONFIG = {
         'vector_weight': 0.4    # 벡터 검색 가중치
     },
     'use_llm_keywords': True,   # LLM 기반 키워드 추출 사용
-    'use_hybrid_search': True   # 하이브리드 검색 사용
+    'use_yake_keywords': False,  # YAKE로 먼저 추출하고 신뢰도가 낮을 때만 LLM 호출 (한국어 질문은 형태소 분리가 안 되어 항상 LLM 사용)
+    'use_hybrid_search': True,  # 하이브리드 검색 사용
+    'cache_ttl': 300,           # 검색 결과 캐시 유지 시간 (초)
+    'cache_size': 256,          # 검색 결과 캐시 최대 항목 수
+    'question_workers': 1,          # 제출 파이프라인에서 동시에 처리할 질문 수 (1이면 순차 처리 + 다음 질문 키워드 미리 추출)
+    'keyword_prefetch_workers': 4,  # 배치 처리 시 질문별 키워드 추출을 미리 동시에 실행할 스레드 수
+    'keyword_cache_similarity': None,  # 설정 시 이전 질문과 임베딩 코사인 유사도가 이 이상이면 LLM 키워드 재사용 (None이면 같은 질문만 재사용)
+    'keyword_cache_size': 512          # 유사 질문 키워드 캐시 최대 항목 수
 }
 
 # 답변 생성 설정
@@ -4,16 +4,97 @@
 - 문서 저장, 검색, 메타데이터 관리
 """
 
+import atexit
 import hashlib
 import json
+import os
+import shutil
 import sqlite3
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+import weakref
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 import chromadb
+import numpy as np
 from sentence_transformers import SentenceTransformer
 
+# 문서 임베딩 시 한 번에 인코딩할 문장 수
+ENCODE_BATCH_SIZE = 128
+
+# 유사 질의 결과 캐시 (쿼리 임베딩 코사인 유사도가 임계값 이상이면 이전 결과 재사용)
+SEMANTIC_CACHE_SIZE = 256
+SEMANTIC_CACHE_THRESHOLD = 0.97
+
+# FAISS 인덱스 int8 스칼라 양자화 (시작 시 벡터가 이 수 이상이면 학습 후 사용, 메모리 1/4)
+FAISS_QUANTIZE_MIN_VECTORS = 1000
+
+# 쿼리 임베딩 디스크 캐시 (메타데이터 DB 옆 파일, clear_db와 무관하게 실행 간 유지)
+QUERY_EMBEDDING_CACHE_FILE = "query_embeddings.npz"
+QUERY_EMBEDDING_SAVE_EVERY = 32  # 새 쿼리 임베딩이 이만큼 쌓이면 중간 저장
+QUERY_EMBEDDING_CACHE_SIZE = 4096  # 최대 보관 수 (초과 시 가장 오래 사용하지 않은 쿼리부터 제거)
+
+# 프로세스 전체에서 공유하는 임베딩 모델 (모델명 -> SentenceTransformer)
+_EMBEDDING_MODELS: Dict[str, SentenceTransformer] = {}
+_EMBEDDING_MODELS_LOCK = threading.Lock()
+
+# 종료 시 쿼리 임베딩을 저장할 문서 관리자들 (약한 참조라 관리자 수명을 늘리지 않음)
+_QUERY_EMBEDDING_STORES: "weakref.WeakSet[DocumentManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_query_embedding_stores():
+    """프로세스 종료 시 살아 있는 문서 관리자의 쿼리 임베딩 캐시 저장"""
+    for manager in list(_QUERY_EMBEDDING_STORES):
+        manager.save_query_embeddings()
+
+
+def _get_embedding_model(model_name: str) -> SentenceTransformer:
+    """
+    임베딩 모델 반환 (최초 요청 시 한 번만 로드)
+    
+    CUDA를 쓸 수 있으면 GPU에 올리고 FP16으로 변환한다.
+    """
+    model = _EMBEDDING_MODELS.get(model_name)
+    if model is not None:
+        return model
+    
+    with _EMBEDDING_MODELS_LOCK:
+        model = _EMBEDDING_MODELS.get(model_name)
+        if model is None:
+            try:
+                import torch
+                use_cuda = torch.cuda.is_available()
+            except ImportError:
+                use_cuda = False
+            
+            model = SentenceTransformer(model_name, device='cuda' if use_cuda else 'cpu')
+            if use_cuda:
+                model = model.half()
+            
+            logging.info(f"임베딩 모델 로드 완료 ({'cuda fp16' if use_cuda else 'cpu'})")
+            _EMBEDDING_MODELS[model_name] = model
+    
+    return model
+
+
+def _embed_query(model_name: str, query: str) -> np.ndarray:
+    """
+    쿼리 임베딩 (캐싱은 DocumentManager.get_query_embedding의 쿼리 임베딩 캐시가 담당)
+    
+    캐시에 저장되어 공유되므로 읽기 전용으로 반환한다.
+    """
+    embedding = _get_embedding_model(model_name).encode(
+        [query],
+        convert_to_numpy=True,
+        normalize_embeddings=True,
+        show_progress_bar=False
+    )[0].astype(np.float32)
+    embedding.setflags(write=False)
+    return embedding
+
 class DocumentManager:
     """통합 문서 관리자 (VectorDB + MetadataManager)"""
     
@@ -49,18 +130,24 @@ class DocumentManager:
         # 임베딩 모델 로드
         self._load_embedding_model()
         
+        # 이전 실행에서 저장한 쿼리 임베딩 로드
+        self._init_query_embedding_store()
+        
         # 벡터 DB 초기화
         self._init_vector_db()
         
         # 메타데이터 DB 초기화
         self._init_metadata_db()
         
+        # 통계 캐시 (문서 저장/검색 이력 저장 시 무효화)
+        self._stats_lock = threading.Lock()
+        self._document_count: Optional[int] = None
+        self._search_stats_cache: Dict[Tuple[Optional[str], int], Dict[str, Any]] = {}
+        
         logging.info("통합 문서 관리자 초기화 완료")
     
     def _clear_databases(self):
         """데이터베이스 초기화"""
-        import shutil
-        
         if self.vector_db_path.exists():
             shutil.rmtree(self.vector_db_path)
             logging.info("벡터 DB 초기화 완료")
@@ -73,12 +160,116 @@ class DocumentManager:
         """임베딩 모델 로드"""
         logging.info(f"임베딩 모델 로딩 중... ({self.embedding_model_name})")
         try:
-            self.embedding_model = SentenceTransformer(self.embedding_model_name)
-            logging.info(f"임베딩 모델 로드 완료 (차원: {self.embedding_model.get_sentence_embedding_dimension()})")
+            self.embedding_model = _get_embedding_model(self.embedding_model_name)
+            logging.info(f"임베딩 모델 준비 완료 (차원: {self.embedding_model.get_sentence_embedding_dimension()})")
         except Exception as e:
             logging.error(f"모델 로드 실패: {e}")
             raise
     
+    def _init_query_embedding_store(self):
+        """쿼리 임베딩 디스크 캐시 로드 (모델이 다르거나 파일이 손상되면 새로 시작)"""
+        self._query_embedding_path = self.metadata_db_path.parent / QUERY_EMBEDDING_CACHE_FILE
+        self._query_embedding_lock = threading.Lock()
+        self._query_embedding_save_lock = threading.Lock()  # 동시에 같은 임시 파일에 쓰지 않도록
+        self._query_embeddings: "OrderedDict[str, np.ndarray]" = OrderedDict()  # 오래 사용하지 않은 순
+        self._unsaved_query_embeddings = 0
+        
+        if self._query_embedding_path.exists():
+            try:
+                with np.load(self._query_embedding_path) as data:
+                    if str(data['model']) == self.embedding_model_name:
+                        # 파일은 오래된 순으로 저장되므로 최근 항목만 로드
+                        queries = data['queries'].tolist()[-QUERY_EMBEDDING_CACHE_SIZE:]
+                        embeddings = data['embeddings'][-QUERY_EMBEDDING_CACHE_SIZE:]
+                        for query, embedding in zip(queries, embeddings):
+                            embedding.setflags(write=False)
+                            self._query_embeddings[query] = embedding
+                logging.info(f"쿼리 임베딩 캐시 로드: {len(self._query_embeddings)}개")
+            except Exception as e:
+                logging.warning(f"쿼리 임베딩 캐시 로드 실패: {e}")
+        
+        _QUERY_EMBEDDING_STORES.add(self)
+    
+    def _put_query_embedding(self, query: str, embedding: np.ndarray):
+        """쿼리 임베딩 캐시에 추가 (_query_embedding_lock 안에서 호출, 가득 차면 가장 오래된 항목 제거)"""
+        if query in self._query_embeddings:
+            self._query_embeddings.move_to_end(query)
+            return
+        
+        self._query_embeddings[query] = embedding
+        self._unsaved_query_embeddings += 1
+        while len(self._query_embeddings) > QUERY_EMBEDDING_CACHE_SIZE:
+            self._query_embeddings.popitem(last=False)
+    
+    def get_query_embedding(self, query: str) -> np.ndarray:
+        """쿼리 임베딩 반환 (디스크/메모리 캐시 → 인코딩 순)"""
+        with self._query_embedding_lock:
+            embedding = self._query_embeddings.get(query)
+            if embedding is not None:
+                self._query_embeddings.move_to_end(query)
+                return embedding
+        
+        embedding = _embed_query(self.embedding_model_name, query)
+        with self._query_embedding_lock:
+            self._put_query_embedding(query, embedding)
+            save_now = self._unsaved_query_embeddings >= QUERY_EMBEDDING_SAVE_EVERY
+        
+        if save_now:
+            self.save_query_embeddings()
+        return embedding
+    
+    def precompute_query_embeddings(self, queries: List[str]) -> int:
+        """
+        여러 쿼리 임베딩을 한 번의 배치 인코딩으로 미리 계산
+        
+        Args:
+            queries: 쿼리 리스트
+            
+        Returns:
+            새로 계산한 임베딩 수
+        """
+        with self._query_embedding_lock:
+            missing = [query for query in dict.fromkeys(queries) if query not in self._query_embeddings]
+        if not missing:
+            return 0
+        
+        embeddings = self._encode(missing).astype(np.float32)
+        embeddings.setflags(write=False)
+        with self._query_embedding_lock:
+            for query, embedding in zip(missing, embeddings):
+                self._put_query_embedding(query, embedding)
+        
+        self.save_query_embeddings()
+        logging.info(f"쿼리 임베딩 미리 계산: {len(missing)}개")
+        return len(missing)
+    
+    def save_query_embeddings(self):
+        """
+        쿼리 임베딩 캐시를 디스크에 저장
+        
+        임시 파일에 모두 쓰고 디스크에 반영한 뒤 os.replace로 교체하므로,
+        저장 도중 중단되어도 기존 파일은 손상되지 않는다. (최대 QUERY_EMBEDDING_CACHE_SIZE개, 오래된 순)
+        """
+        with self._query_embedding_save_lock:
+            with self._query_embedding_lock:
+                if not self._unsaved_query_embeddings:
+                    return
+                queries = list(self._query_embeddings)
+                embeddings = np.stack([self._query_embeddings[query] for query in queries])
+                self._unsaved_query_embeddings = 0
+            
+            tmp_path = self._query_embedding_path.with_suffix('.tmp')
+            try:
+                with open(tmp_path, 'wb') as f:
+                    np.savez(f, model=np.array(self.embedding_model_name),
+                             queries=np.array(queries), embeddings=embeddings)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, self._query_embedding_path)
+                logging.info(f"쿼리 임베딩 캐시 저장: {len(queries)}개")
+            except Exception as e:
+                logging.warning(f"쿼리 임베딩 캐시 저장 실패: {e}")
+    
     def _init_vector_db(self):
         """벡터 DB 초기화"""
         try:
@@ -89,6 +280,136 @@ class DocumentManager:
             # 인메모리 모드로 전환
             self.vector_client = chromadb.Client()
             self.vector_collection = self._get_or_create_vector_collection()
+        
+        # 벡터 DB에 있는 문서 ID (시작 시 한 번만 읽고 이후에는 추가할 때 갱신)
+        # 중복 확인부터 Chroma/FAISS 추가까지는 _vector_store_lock 안에서 수행 (동시 저장 시 같은 문서 중복 추가 방지)
+        self._vector_store_lock = threading.Lock()
+        try:
+            self._vector_ids = set(self.vector_collection.get(include=[])['ids'])
+        except Exception as e:
+            logging.warning(f"벡터 DB 문서 ID 조회 실패: {e}")
+            self._vector_ids = set()
+        
+        # 조회 전용 FAISS 인덱스 (faiss 설치 시, Chroma는 영구 저장소로 유지)
+        self._init_faiss_index()
+        
+        # 유사 질의 캐시: 정규화된 쿼리 임베딩을 담는 고정 크기 링 버퍼 행렬과
+        # 같은 위치의 (max_results, 임계값, 결과) 항목
+        self._semantic_cache_lock = threading.Lock()
+        self._semantic_cache_matrix: Optional[np.ndarray] = None  # 첫 저장 시 할당
+        self._semantic_cache_entries: List[Optional[Tuple[int, float, List[Dict]]]] = [None] * SEMANTIC_CACHE_SIZE
+        self._semantic_cache_count = 0  # 채워진 행 수
+        self._semantic_cache_next = 0   # 다음에 덮어쓸 행 (가장 오래된 항목)
+    
+    def _init_faiss_index(self):
+        """벡터 DB 임베딩으로 메모리 내 FAISS 내적 인덱스 구성 (faiss 미설치 시 Chroma로 검색)"""
+        self._faiss_lock = threading.Lock()
+        self._faiss_index = None
+        self._faiss_ids: List[str] = []
+        self._faiss_metadatas: List[Dict] = []
+        
+        try:
+            import faiss
+        except ImportError:
+            logging.info("faiss가 설치되어 있지 않아 Chroma로 벡터 검색합니다.")
+            return
+        
+        try:
+            dimension = self.embedding_model.get_sentence_embedding_dimension()
+            stored = self.vector_collection.get(include=['embeddings', 'metadatas'])
+            
+            # 양자화 학습에 충분한 벡터가 있으면 int8 인덱스, 아니면 FP32 평면 인덱스
+            if len(stored['ids']) >= FAISS_QUANTIZE_MIN_VECTORS:
+                index = faiss.IndexScalarQuantizer(
+                    dimension, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+                )
+            else:
+                index = faiss.IndexFlatIP(dimension)
+            
+            if stored['ids']:
+                embeddings = np.asarray(stored['embeddings'], dtype=np.float32)
+                faiss.normalize_L2(embeddings)
+                if not index.is_trained:
+                    index.train(embeddings)
+                index.add(embeddings)
+                self._faiss_ids = list(stored['ids'])
+                self._faiss_metadatas = list(stored['metadatas'])
+            self._faiss_index = index
+            logging.info(f"FAISS 인덱스 구성 완료: {index.ntotal}개 ({type(index).__name__})")
+        except Exception as e:
+            logging.warning(f"FAISS 인덱스 구성 실패, Chroma로 벡터 검색합니다: {e}")
+    
+    def _add_to_faiss_index(self, doc_ids: List[str], embeddings: np.ndarray, metadatas: List[Dict]):
+        """새로 저장한 벡터를 FAISS 인덱스에도 추가"""
+        if self._faiss_index is None:
+            return
+        
+        with self._faiss_lock:
+            self._faiss_index.add(np.ascontiguousarray(embeddings, dtype=np.float32))
+            self._faiss_ids.extend(doc_ids)
+            self._faiss_metadatas.extend(metadatas)
+    
+    def _query_faiss_index(self, query_embedding: np.ndarray, max_results: int) -> Tuple[List[str], List[Dict], np.ndarray]:
+        """
+        FAISS 인덱스 검색
+        
+        Returns:
+            (문서 ID 리스트, 메타데이터 리스트, 유사도 배열)
+            유사도는 Chroma 기본 거리(제곱 L2)와 같은 기준이 되도록 1 - ||q - d||² = 2·cos - 1로 변환
+        """
+        with self._faiss_lock:
+            if self._faiss_index.ntotal == 0:
+                return [], [], np.empty(0)
+            
+            scores, indices = self._faiss_index.search(
+                np.array(query_embedding[np.newaxis, :]), min(max_results, self._faiss_index.ntotal)
+            )
+            hits = indices[0] >= 0
+            indices = indices[0][hits]
+            ids = [self._faiss_ids[i] for i in indices]
+            metadatas = [self._faiss_metadatas[i] for i in indices]
+        
+        return ids, metadatas, 2.0 * scores[0][hits].astype(np.float64) - 1.0
+    
+    def _lookup_semantic_cache(self, query_embedding: np.ndarray, max_results: int,
+                               similarity_threshold: float) -> Optional[List[Dict]]:
+        """유사 질의 캐시 조회 (적중 시 결과 사본 반환)"""
+        with self._semantic_cache_lock:
+            if not self._semantic_cache_count:
+                return None
+            
+            # 임계값을 넘는 행만 골라 유사도 높은 순으로 확인
+            sims = self._semantic_cache_matrix[:self._semantic_cache_count] @ query_embedding
+            candidates = np.flatnonzero(sims >= SEMANTIC_CACHE_THRESHOLD)
+            for index in candidates[np.argsort(-sims[candidates])]:
+                cached_max, cached_threshold, documents = self._semantic_cache_entries[index]
+                if cached_max == max_results and cached_threshold == similarity_threshold:
+                    return [doc.copy() for doc in documents]
+        
+        return None
+    
+    def _store_semantic_cache(self, query_embedding: np.ndarray, max_results: int,
+                              similarity_threshold: float, documents: List[Dict]):
+        """유사 질의 캐시 저장 (가득 차면 가장 오래된 행을 덮어씀)"""
+        entry = (max_results, similarity_threshold, [doc.copy() for doc in documents])
+        with self._semantic_cache_lock:
+            if self._semantic_cache_matrix is None:
+                self._semantic_cache_matrix = np.empty(
+                    (SEMANTIC_CACHE_SIZE, query_embedding.shape[0]), dtype=np.float32
+                )
+            
+            index = self._semantic_cache_next
+            self._semantic_cache_matrix[index] = query_embedding
+            self._semantic_cache_entries[index] = entry
+            self._semantic_cache_next = (index + 1) % SEMANTIC_CACHE_SIZE
+            self._semantic_cache_count = min(self._semantic_cache_count + 1, SEMANTIC_CACHE_SIZE)
+    
+    def clear_semantic_cache(self):
+        """유사 질의 캐시 비우기 (벡터 DB에 문서가 추가되면 호출)"""
+        with self._semantic_cache_lock:
+            self._semantic_cache_entries = [None] * SEMANTIC_CACHE_SIZE
+            self._semantic_cache_count = 0
+            self._semantic_cache_next = 0
     
     def _get_or_create_vector_collection(self):
         """벡터 컬렉션 생성 또는 가져오기"""
@@ -156,22 +477,22 @@ class DocumentManager:
         if not documents:
             return 0
         
-        stored_count = 0
-        
+        # 1. 메타데이터 DB에 저장 (성공한 문서만 벡터화 대상)
+        pending = []
         for doc in documents:
             try:
-                # 문서 ID 생성
                 doc_id = self._generate_document_id(doc)
-                
-                # 메타데이터 DB에 저장
                 if self._store_document_metadata(doc_id, doc, metadata):
-                    # 벡터 DB에 저장
-                    if self._store_document_vector(doc_id, doc):
-                        stored_count += 1
-                        
+                    pending.append((doc_id, doc))
             except Exception as e:
                 logging.warning(f"문서 저장 실패: {e}")
-                continue
+        
+        # 2. 벡터 DB에 저장 (임베딩은 한 번의 encode 호출로 일괄 생성)
+        stored_count = self._store_document_vectors(pending)
+        
+        if pending:
+            with self._stats_lock:
+                self._document_count = None
         
         logging.info(f"문서 저장 완료: {stored_count}개")
         return stored_count
@@ -207,30 +528,101 @@ class DocumentManager:
             logging.error(f"메타데이터 저장 실패: {e}")
             return False
     
-    def _store_document_vector(self, doc_id: str, doc: Dict) -> bool:
-        """문서 벡터 저장"""
-        try:
-            # 문서 텍스트 생성
-            text = f"{doc.get('title', '')} {doc.get('abstract', '')}"
-            
-            # 임베딩 생성
-            embedding = self.embedding_model.encode([text])[0]
+    def _document_vector_fields(self, doc: Dict) -> Tuple[str, Dict[str, str]]:
+        """임베딩용 문서 텍스트와 벡터 DB에 함께 저장할 메타데이터"""
+        get = doc.get
+        title = get('title', '')
+        abstract = get('abstract', '')
+        return f"{title} {abstract}", {
+            'title': title,
+            'abstract': abstract,
+            'source': get('source', '')
+        }
+    
+    def _encode(self, texts: List[str]):
+        """텍스트 임베딩 (정규화된 numpy 배열)"""
+        return self.embedding_model.encode(
+            texts,
+            batch_size=ENCODE_BATCH_SIZE,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+    
+    def _store_document_vectors(self, pending: List[Tuple[str, Dict]]) -> int:
+        """
+        문서 벡터 일괄 저장 (이미 벡터 DB에 있는 문서는 임베딩하지 않음)
+        
+        여러 질문이 동시에 저장해도 같은 문서가 두 번 추가되지 않도록
+        중복 확인과 추가를 하나의 잠금 안에서 처리한다.
+        
+        Args:
+            pending: (문서 ID, 문서) 리스트
             
-            # 벡터 DB에 저장
+        Returns:
+            새로 저장된 문서 수
+        """
+        with self._vector_store_lock:
+            return self._store_new_document_vectors(pending)
+    
+    def _store_new_document_vectors(self, pending: List[Tuple[str, Dict]]) -> int:
+        """문서 벡터 저장 본체 (_vector_store_lock 안에서 호출)"""
+        # 이미 저장된 ID와 같은 배치 안의 중복 ID를 제외하면서 (먼저 나온 문서 유지)
+        # ID, 텍스트, 메타데이터를 한 번에 구성
+        doc_ids, texts, metadatas = [], [], []
+        new_ids = set()
+        vector_ids = self._vector_ids
+        for doc_id, doc in pending:
+            if doc_id in vector_ids or doc_id in new_ids:
+                continue
+            new_ids.add(doc_id)
+            text, metadata = self._document_vector_fields(doc)
+            doc_ids.append(doc_id)
+            texts.append(text)
+            metadatas.append(metadata)
+        
+        if not doc_ids:
+            return 0
+        
+        try:
+            embeddings = self._encode(texts)
+        except Exception as e:
+            logging.error(f"벡터 저장 실패: {e}")
+            return 0
+        
+        try:
             self.vector_collection.add(
-                embeddings=[embedding.tolist()],
-                documents=[text],
-                ids=[doc_id],
-                metadatas=[{
-                    'title': doc.get('title', ''),
-                    'abstract': doc.get('abstract', ''),
-                    'source': doc.get('source', '')
-                }]
+                embeddings=embeddings.tolist(),
+                documents=texts,
+                ids=doc_ids,
+                metadatas=metadatas
             )
-            return True
+            self._vector_ids.update(new_ids)
+            self._add_to_faiss_index(doc_ids, embeddings, metadatas)
+            self.clear_semantic_cache()
+            return len(doc_ids)
         except Exception as e:
-            logging.error(f"벡터 저장 실패: {e}")
-            return False
+            # 이미 있는 ID 등으로 일괄 추가가 실패하면 문서별로 다시 시도
+            logging.debug(f"벡터 일괄 저장 실패, 문서별 저장으로 전환: {e}")
+        
+        stored_count = 0
+        for doc_id, metadata, text, embedding in zip(doc_ids, metadatas, texts, embeddings):
+            try:
+                self.vector_collection.add(
+                    embeddings=[embedding.tolist()],
+                    documents=[text],
+                    ids=[doc_id],
+                    metadatas=[metadata]
+                )
+                self._vector_ids.add(doc_id)
+                self._add_to_faiss_index([doc_id], embedding[np.newaxis, :], [metadata])
+                stored_count += 1
+            except Exception as e:
+                logging.error(f"벡터 저장 실패: {e}")
+        
+        if stored_count:
+            self.clear_semantic_cache()
+        return stored_count
     
     def search_similar_documents(self, query: str, max_results: int = 50, 
                                 similarity_threshold: float = 0.3) -> List[Dict]:
@@ -247,32 +639,42 @@ class DocumentManager:
         """
         try:
             # 쿼리 임베딩 생성
-            query_embedding = self.embedding_model.encode([query])[0]
+            query_embedding = self.get_query_embedding(query)
             
-            # 벡터 검색
-            results = self.vector_collection.query(
-                query_embeddings=[query_embedding.tolist()],
-                n_results=max_results,
-                include=['documents', 'metadatas', 'distances']
-            )
+            # 거의 같은 질의를 이전에 검색했다면 벡터 검색 생략
+            cached = self._lookup_semantic_cache(query_embedding, max_results, similarity_threshold)
+            if cached is not None:
+                logging.info(f"유사 문서 검색 캐시 적중: {len(cached)}개")
+                return cached
+            
+            # 벡터 검색 (FAISS 인덱스가 있으면 우선 사용)
+            if self._faiss_index is not None:
+                ids, metadatas, similarities = self._query_faiss_index(query_embedding, max_results)
+            else:
+                results = self.vector_collection.query(
+                    query_embeddings=[query_embedding.tolist()],
+                    n_results=max_results,
+                    include=['metadatas', 'distances']
+                )
+                ids = results['ids'][0] if results['ids'] else []
+                metadatas = results['metadatas'][0] if ids else []
+                # 거리를 유사도로 한 번에 변환
+                similarities = 1.0 - np.asarray(results['distances'][0] if ids else [], dtype=np.float64)
             
-            # 결과 변환
+            # 결과 변환 (임계값 이상인 결과만 선택)
             documents = []
-            if results['ids'] and results['ids'][0]:
-                for i, doc_id in enumerate(results['ids'][0]):
-                    distance = results['distances'][0][i]
-                    similarity = 1 - distance  # 거리를 유사도로 변환
-                    
-                    if similarity >= similarity_threshold:
-                        doc = {
-                            'CN': doc_id,
-                            'title': results['metadatas'][0][i].get('title', ''),
-                            'abstract': results['metadatas'][0][i].get('abstract', ''),
-                            'source': results['metadatas'][0][i].get('source', ''),
-                            'similarity': similarity
-                        }
-                        documents.append(doc)
+            if ids:
+                for i in np.flatnonzero(similarities >= similarity_threshold):
+                    metadata = metadatas[i]
+                    documents.append({
+                        'CN': ids[i],
+                        'title': metadata.get('title', ''),
+                        'abstract': metadata.get('abstract', ''),
+                        'source': metadata.get('source', ''),
+                        'similarity': float(similarities[i])
+                    })
             
+            self._store_semantic_cache(query_embedding, max_results, similarity_threshold, documents)
             logging.info(f"유사 문서 검색 완료: {len(documents)}개")
             return documents
             
@@ -298,11 +700,19 @@ class DocumentManager:
                     json.dumps(keywords or []), result_count, search_time, 
                     success, error_message
                 ))
+            with self._stats_lock:
+                self._search_stats_cache.clear()
         except Exception as e:
             logging.error(f"검색 이력 저장 실패: {e}")
     
     def get_search_statistics(self, dataset_name: str = None, days: int = 30) -> Dict[str, Any]:
-        """검색 통계 조회"""
+        """검색 통계 조회 (검색 이력이 추가되기 전까지는 캐시된 결과 반환)"""
+        cache_key = (dataset_name, days)
+        with self._stats_lock:
+            cached = self._search_stats_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached)
+        
         try:
             with sqlite3.connect(self.metadata_db_path) as conn:
                 where_clause = "created_at >= datetime('now', '-{} days')".format(days)
@@ -324,7 +734,7 @@ class DocumentManager:
                 """, params)
                 
                 row = cursor.fetchone()
-                return {
+                stats = {
                     'total_searches': row[0] or 0,
                     'avg_search_time': row[1] or 0,
                     'avg_result_count': row[2] or 0,
@@ -332,16 +742,26 @@ class DocumentManager:
                     'failed_searches': row[4] or 0,
                     'success_rate': (row[3] or 0) / max(row[0] or 1, 1) * 100
                 }
+            with self._stats_lock:
+                self._search_stats_cache[cache_key] = stats
+            return dict(stats)
         except Exception as e:
             logging.error(f"검색 통계 조회 실패: {e}")
             return {}
     
     def get_document_count(self) -> int:
-        """저장된 문서 수 조회"""
+        """저장된 문서 수 조회 (문서가 새로 저장되기 전까지는 캐시된 값 반환)"""
+        with self._stats_lock:
+            if self._document_count is not None:
+                return self._document_count
+        
         try:
             with sqlite3.connect(self.metadata_db_path) as conn:
                 cursor = conn.execute("SELECT COUNT(*) FROM documents")
-                return cursor.fetchone()[0]
+                document_count = cursor.fetchone()[0]
+            with self._stats_lock:
+                self._document_count = document_count
+            return document_count
         except Exception as e:
             logging.error(f"문서 수 조회 실패: {e}")
             return 0
@@ -349,21 +769,14 @@ class DocumentManager:
     def get_stats(self) -> Dict[str, Any]:
         """통계 정보 반환"""
         try:
-            with sqlite3.connect(self.metadata_db_path) as conn:
-                # 문서 수
-                cursor = conn.execute("SELECT COUNT(*) FROM documents")
-                document_count = cursor.fetchone()[0]
-                
-                # 컬렉션 수
-                collection_count = self.collection.count()
-                
-                return {
-                    "document_count": document_count,
-                    "collection_count": collection_count,
-                    "embedding_model": self.embedding_model_name,
-                    "vector_db_path": str(self.vector_db_path),
-                    "metadata_db_path": str(self.metadata_db_path)
-                }
+            # 벡터 수는 벡터 DB와 동기화된 ID 집합으로 계산 (컬렉션 조회 생략)
+            return {
+                "document_count": self.get_document_count(),
+                "collection_count": len(self._vector_ids),
+                "embedding_model": self.embedding_model_name,
+                "vector_db_path": str(self.vector_db_path),
+                "metadata_db_path": str(self.metadata_db_path)
+            }
         except Exception as e:
             logging.error(f"통계 정보 조회 실패: {e}")
             return {
@@ -6,9 +6,11 @@
 from .llm_extractor import LLMKeywordExtractor
 from .basic_extractor import BasicKeywordExtractor
 from .domain_extractor import DomainKeywordExtractor
+from .yake_extractor import YakeKeywordExtractor
 
 __all__ = [
     'LLMKeywordExtractor',
     'BasicKeywordExtractor',
-    'DomainKeywordExtractor'
+    'DomainKeywordExtractor',
+    'YakeKeywordExtractor'
 ]
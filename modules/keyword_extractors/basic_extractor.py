@@ -5,10 +5,137 @@
 
 import re
 import logging
+import threading
+from functools import lru_cache
 from typing import List
-from konlpy.tag import Okt
 from .base_extractor import KeywordExtractor
 
+# 자주 쓰는 정규식은 모듈 로드 시 한 번만 컴파일
+_WORD_RE = re.compile(r'\w+')
+# ASCII 텍스트용 단어 분리 테이블: 영숫자와 '_'(= ASCII에서의 \w)만 남기고 나머지 바이트는 공백으로
+_ASCII_WORD_TABLE = bytes(
+    byte if byte < 128 and (chr(byte).isalnum() or byte == 0x5F) else 0x20
+    for byte in range(256)
+)
+_KOREAN_RE = re.compile('[가-힣]')
+_KOREAN_PROBE_LENGTH = 64  # 언어 판별 시 검사할 앞부분 길이
+_SPECIAL_TERM_PATTERNS = (
+    re.compile(r'\b[A-Z]{2,}\b'),  # 약어 (대문자 2개 이상)
+    re.compile(r'\b\w+-\w+\b'),   # 하이픈이 있는 복합어
+    re.compile(r'\b\w+_\w+\b'),   # 언더스코어가 있는 용어
+)
+
+# kiwipiepy 명사 품사 태그 (일반/고유 명사)
+_KIWI_NOUN_TAGS = ('NNG', 'NNP')
+
+# 영어 불용어
+_ENGLISH_STOP_WORDS = frozenset({
+    'a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
+    'how', 'what', 'why', 'when', 'where', 'which', 'who', 'whom', 'whose',
+    'can', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might',
+    'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had',
+    'this', 'that', 'these', 'those', 'it', 'its', 'they', 'them', 'their',
+    'we', 'you', 'he', 'she', 'his', 'her', 'our', 'your', 'my', 'me', 'i'
+})
+
+# 전문 용어
+_TECHNICAL_TERMS = frozenset({
+    'neural', 'artificial', 'machine', 'learning', 'deep', 'network', 
+    'algorithm', 'model', 'system', 'method', 'approach', 'technique',
+    'sustainability', 'corporate', 'culture', 'development', 'management',
+    'analysis', 'research', 'study', 'framework', 'architecture',
+    '인공지능', '머신러닝', '딥러닝', '알고리즘', '시스템', '분석', '연구'
+})
+
+
+def _load_noun_analyzer():
+    """
+    명사 추출 함수 생성
+    
+    JVM이 필요 없는 분석기를 우선 사용한다.
+    python-mecab-ko → kiwipiepy → konlpy Mecab (mecab-ko 시스템 설치 필요) → konlpy Okt 순서로 시도.
+    """
+    try:
+        from mecab import MeCab
+        mecab = MeCab()
+        logging.info("한국어 형태소 분석기: python-mecab-ko")
+        return mecab.nouns
+    except Exception as e:
+        logging.debug(f"python-mecab-ko 사용 불가: {e}")
+    
+    try:
+        from kiwipiepy import Kiwi
+    except ImportError:
+        Kiwi = None
+    
+    if Kiwi is not None:
+        kiwi = Kiwi()
+        logging.info("한국어 형태소 분석기: kiwipiepy")
+        return lambda text: [token.form for token in kiwi.tokenize(text)
+                             if token.tag in _KIWI_NOUN_TAGS]
+    
+    try:
+        from konlpy.tag import Mecab
+        mecab = Mecab()
+        logging.info("한국어 형태소 분석기: konlpy Mecab")
+        return mecab.nouns
+    except Exception as e:
+        logging.debug(f"Mecab 사용 불가, Okt로 대체: {e}")
+    
+    from konlpy.tag import Okt
+    logging.info("한국어 형태소 분석기: konlpy Okt")
+    return Okt().nouns
+
+
+# 프로세스 전체에서 공유하는 명사 추출 함수 (추출기 인스턴스마다 JVM/모델을 다시 띄우지 않도록)
+_NOUN_ANALYZER = None
+_NOUN_ANALYZER_LOCK = threading.Lock()
+
+
+def _get_noun_analyzer():
+    """공유 명사 추출 함수 반환 (최초 호출 시 로드)"""
+    global _NOUN_ANALYZER
+    if _NOUN_ANALYZER is None:
+        with _NOUN_ANALYZER_LOCK:
+            if _NOUN_ANALYZER is None:
+                _NOUN_ANALYZER = _load_noun_analyzer()
+    return _NOUN_ANALYZER
+
+
+@lru_cache(maxsize=256)
+def _extract_nouns(text: str) -> tuple:
+    """명사 추출 (같은 텍스트는 형태소 분석기를 다시 호출하지 않음)"""
+    return tuple(_get_noun_analyzer()(text))
+
+
+@lru_cache(maxsize=512)
+def _extract_special_terms(query: str) -> tuple:
+    """특수 용어 추출 (약어, 하이픈/언더스코어 복합어)"""
+    special_terms = []
+    for pattern in _SPECIAL_TERM_PATTERNS:
+        special_terms.extend(pattern.findall(query))
+    
+    # 같은 용어가 여러 번 등장해도 처음 위치 기준으로 한 번만
+    return tuple(dict.fromkeys(special_terms))
+
+
+def _split_words(text: str) -> List[str]:
+    """
+    단어 분리 (_WORD_RE.findall과 같은 결과)
+    
+    ASCII 텍스트는 바이트 변환 테이블로 구분 문자를 공백으로 바꾼 뒤 split 하여
+    정규식 엔진을 거치지 않는다.
+    """
+    if text.isascii():
+        return text.encode('ascii').translate(_ASCII_WORD_TABLE).decode('ascii').split()
+    return _WORD_RE.findall(text)
+
+
+@lru_cache(maxsize=512)
+def _is_korean(text: str) -> bool:
+    """한국어 텍스트 감지 (질문의 앞부분만 검사)"""
+    return bool(_KOREAN_RE.search(text, 0, _KOREAN_PROBE_LENGTH))
+
 class BasicKeywordExtractor(KeywordExtractor):
     """기본 키워드 추출기 (한국어/영어 지원)"""
     
@@ -26,26 +153,17 @@ class BasicKeywordExtractor(KeywordExtractor):
             'use_special_terms': True
         }
         self.extractor_name = "basic_extractor"
-        self.okt = Okt()
-        
-        # 영어 불용어 정의
-        self.english_stop_words = {
-            'a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
-            'how', 'what', 'why', 'when', 'where', 'which', 'who', 'whom', 'whose',
-            'can', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might',
-            'is', 'are', 'was', 'were', 'be', 'been', 'being', 'have', 'has', 'had',
-            'this', 'that', 'these', 'those', 'it', 'its', 'they', 'them', 'their',
-            'we', 'you', 'he', 'she', 'his', 'her', 'our', 'your', 'my', 'me', 'i'
-        }
+        self._keyword_cache = {}  # 질문 -> 추출 키워드 (설정 변경 시 초기화)
+        self._keyword_cache_lock = threading.Lock()  # 여러 질문을 동시에 처리할 때 캐시 보호
+        self._cache_size = 512
         
-        # 전문 용어 정의
-        self.technical_terms = {
-            'neural', 'artificial', 'machine', 'learning', 'deep', 'network', 
-            'algorithm', 'model', 'system', 'method', 'approach', 'technique',
-            'sustainability', 'corporate', 'culture', 'development', 'management',
-            'analysis', 'research', 'study', 'framework', 'architecture',
-            '인공지능', '머신러닝', '딥러닝', '알고리즘', '시스템', '분석', '연구'
-        }
+        # 불용어/전문 용어는 모듈 상수를 공유 (인스턴스마다 집합을 새로 만들지 않음)
+        self.english_stop_words = _ENGLISH_STOP_WORDS
+        self.technical_terms = _TECHNICAL_TERMS
+    
+    def _nouns(self, text: str) -> List[str]:
+        """명사 추출 (형태소 분석기는 한국어 질의가 처음 들어올 때 로드, 결과는 프로세스 전체에서 캐싱)"""
+        return list(_extract_nouns(text))
     
     def extract_keywords(self, query: str, **kwargs) -> List[str]:
         """
@@ -58,6 +176,11 @@ class BasicKeywordExtractor(KeywordExtractor):
         Returns:
             추출된 키워드 리스트
         """
+        with self._keyword_cache_lock:
+            cached = self._keyword_cache.get(query)
+        if cached is not None:
+            return list(cached)
+        
         if self._is_korean(query):
             keywords = self._extract_korean_keywords(query)
         else:
@@ -68,31 +191,38 @@ class BasicKeywordExtractor(KeywordExtractor):
             special_terms = self._extract_special_terms(query)
             keywords.extend(special_terms)
         
-        # 중복 제거 및 정렬
-        keywords = list(set(keywords))
-        keywords.sort(key=len, reverse=True)  # 긴 키워드 우선
+        # 중복 제거 및 정렬 (등장 순서 유지, 같은 길이는 먼저 나온 키워드 우선)
+        keywords = sorted(dict.fromkeys(keywords), key=len, reverse=True)  # 긴 키워드 우선
         
         logging.info(f"기본 키워드 추출: {', '.join(keywords)}")
-        return keywords[:self.config['max_keywords']]
+        keywords = keywords[:self.config['max_keywords']]
+        
+        with self._keyword_cache_lock:
+            if len(self._keyword_cache) >= self._cache_size:
+                self._keyword_cache.pop(next(iter(self._keyword_cache)), None)  # 가장 오래된 항목 제거
+            self._keyword_cache[query] = tuple(keywords)
+        return keywords
     
     def _extract_korean_keywords(self, query: str) -> List[str]:
         """한국어 키워드 추출"""
         # 명사 추출
-        nouns = self.okt.nouns(query)
+        nouns = self._nouns(query)
         keywords = [noun for noun in nouns if len(noun) > 1]
         
-        # 전문 용어 보존
+        # 전문 용어 보존 (포함 여부는 집합으로 확인)
         if self.config.get('use_technical_terms', True):
+            seen = set(keywords)
             for term in self.technical_terms:
-                if term in query and term not in keywords:
+                if term in query and term not in seen:
                     keywords.append(term)
+                    seen.add(term)
         
         return keywords
     
     def _extract_english_keywords(self, query: str) -> List[str]:
         """영어 키워드 추출"""
         # 단어 분리
-        words = re.findall(r'\w+', query.lower())
+        words = _split_words(query.lower())
         
         # 불용어 제거
         filtered_words = [word for word in words 
@@ -113,25 +243,11 @@ class BasicKeywordExtractor(KeywordExtractor):
     
     def _extract_special_terms(self, query: str) -> List[str]:
         """특수 용어 추출"""
-        special_terms = []
-        
-        # 약어 패턴 (대문자 2개 이상)
-        abbreviations = re.findall(r'\b[A-Z]{2,}\b', query)
-        special_terms.extend(abbreviations)
-        
-        # 하이픈이 있는 복합어
-        hyphenated = re.findall(r'\b\w+-\w+\b', query)
-        special_terms.extend(hyphenated)
-        
-        # 언더스코어가 있는 용어
-        underscored = re.findall(r'\b\w+_\w+\b', query)
-        special_terms.extend(underscored)
-        
-        return special_terms
+        return list(_extract_special_terms(query))
     
     def _is_korean(self, text: str) -> bool:
         """한국어 텍스트 감지"""
-        return bool(re.search('[가-힣]', text))
+        return _is_korean(text)
     
     def get_extractor_name(self) -> str:
         return self.extractor_name
@@ -142,4 +258,6 @@ class BasicKeywordExtractor(KeywordExtractor):
     def update_config(self, new_config: dict):
         """설정 업데이트"""
         self.config.update(new_config)
+        with self._keyword_cache_lock:
+            self._keyword_cache.clear()
         logging.info(f"기본 추출기 설정 업데이트: {new_config}")
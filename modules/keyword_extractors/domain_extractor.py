@@ -3,10 +3,29 @@
 - 특정 분야에 특화된 키워드 추출
 """
 
+import re
 import logging
-from typing import List, Dict
+import threading
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 from .base_extractor import KeywordExtractor
 
+# 영숫자가 아닌 문자 (str.isalnum 기준과 동일하게 밑줄도 제외)
+_NON_ALNUM_RE = re.compile(r'[\W_]+')
+
+
+@lru_cache(maxsize=512)
+def _extract_general_keywords(query: str) -> tuple:
+    """일반 키워드 추출 (길이가 3 초과인 단어만 골라 특수 문자를 한 번에 제거)"""
+    keywords = []
+    for word in query.split():
+        if len(word) > 3:
+            clean_word = _NON_ALNUM_RE.sub('', word)
+            if clean_word:
+                keywords.append(clean_word)
+    
+    return tuple(keywords)
+
 class DomainKeywordExtractor(KeywordExtractor):
     """도메인별 키워드 추출기"""
     
@@ -23,6 +42,10 @@ class DomainKeywordExtractor(KeywordExtractor):
             'use_synonyms': True
         }
         self.extractor_name = "domain_extractor"
+        self._term_matchers = {}  # 용어 튜플 -> (컴파일된 패턴, 포함 관계)
+        self._keyword_cache = {}  # (질문, 도메인) -> 추출 키워드 (설정/용어 변경 시 초기화)
+        self._keyword_cache_lock = threading.Lock()  # 여러 질문을 동시에 처리할 때 캐시 보호
+        self._cache_size = 512
         
         # 도메인별 전문 용어 사전
         self.domain_terms = {
@@ -64,57 +87,94 @@ class DomainKeywordExtractor(KeywordExtractor):
             추출된 키워드 리스트
         """
         domain = kwargs.get('domain', self.config['domain'])
-        keywords = []
+        
+        cache_key = (query, domain)
+        with self._keyword_cache_lock:
+            cached = self._keyword_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+        
+        # 순서를 유지하며 바로 중복 제거 (도메인 용어 → 동의어 → 일반 키워드 우선순위)
+        keywords = {}
         
         # 도메인별 전문 용어 추출
         if domain in self.domain_terms:
             domain_data = self.domain_terms[domain]
+            synonyms_dict = domain_data.get('synonyms', {})
+            
+            # 전문 용어와 동의어 대표 용어를 한 번의 스캔으로 매칭
+            matched = self._match_terms(query, tuple(domain_data['keywords']) + tuple(synonyms_dict))
             
             # 직접 매칭되는 키워드
             for term in domain_data['keywords']:
-                if term.lower() in query.lower():
-                    keywords.append(term)
+                if term.lower() in matched:
+                    keywords.setdefault(term)
             
             # 동의어 확장
             if self.config.get('use_synonyms', True):
-                synonyms = self._extract_synonyms(query, domain_data.get('synonyms', {}))
-                keywords.extend(synonyms)
+                for synonym in self._extract_synonyms(query, synonyms_dict, matched):
+                    keywords.setdefault(synonym)
         
         # 일반 키워드도 추출
-        general_keywords = self._extract_general_keywords(query)
-        keywords.extend(general_keywords)
+        for keyword in self._extract_general_keywords(query):
+            keywords.setdefault(keyword)
         
-        # 중복 제거
-        keywords = list(set(keywords))
+        keywords = list(keywords)
         
         logging.info(f"도메인 키워드 추출 ({domain}): {', '.join(keywords)}")
-        return keywords[:self.config['max_keywords']]
+        keywords = keywords[:self.config['max_keywords']]
+        
+        with self._keyword_cache_lock:
+            if len(self._keyword_cache) >= self._cache_size:
+                self._keyword_cache.pop(next(iter(self._keyword_cache)), None)  # 가장 오래된 항목 제거
+            self._keyword_cache[cache_key] = tuple(keywords)
+        return keywords
     
-    def _extract_synonyms(self, query: str, synonyms_dict: Dict[str, List[str]]) -> List[str]:
-        """동의어 추출"""
+    def _extract_synonyms(self, query: str, synonyms_dict: Dict[str, List[str]],
+                          matched: Optional[set] = None) -> List[str]:
+        """동의어 추출 (모든 대표 용어를 한 번의 스캔으로 매칭, 이미 매칭한 결과가 있으면 재사용)"""
+        if not synonyms_dict:
+            return []
+        
+        if matched is None:
+            matched = self._match_terms(query, tuple(synonyms_dict))
         found_synonyms = []
         
+        # 사전 순서를 유지하여 기존 결과와 동일한 순서로 확장
         for main_term, synonyms in synonyms_dict.items():
-            if main_term.lower() in query.lower():
+            if main_term.lower() in matched:
                 found_synonyms.extend(synonyms)
         
         return found_synonyms
     
-    def _extract_general_keywords(self, query: str) -> List[str]:
-        """일반 키워드 추출"""
-        # 간단한 단어 분리
-        words = query.split()
-        keywords = []
+    def _match_terms(self, query: str, terms: Tuple[str, ...]) -> set:
+        """
+        질문에 등장하는 용어 집합 반환 (소문자 기준)
         
-        for word in words:
-            # 길이가 3 이상인 단어만
-            if len(word) > 3:
-                # 특수 문자 제거
-                clean_word = ''.join(c for c in word if c.isalnum())
-                if clean_word:
-                    keywords.append(clean_word)
+        용어별 부분 문자열 검사 대신 전체 용어를 하나의 정규식으로 묶어
+        질문을 한 번만 훑는다. 같은 위치에서 시작하는 짧은 용어는 긴 용어에
+        가려지므로, 긴 용어에 포함된 용어도 함께 매칭된 것으로 본다.
+        """
+        matcher = self._term_matchers.get(terms)
+        if matcher is None:
+            lowered = sorted({term.lower() for term in terms}, key=len, reverse=True)
+            pattern = re.compile('(?=(' + '|'.join(map(re.escape, lowered)) + '))')
+            contained = {
+                term: [other for other in lowered if other != term and other in term]
+                for term in lowered
+            }
+            matcher = (pattern, contained)
+            self._term_matchers[terms] = matcher
         
-        return keywords
+        pattern, contained = matcher
+        matched = set(pattern.findall(query.lower()))
+        for term in list(matched):
+            matched.update(contained[term])
+        return matched
+    
+    def _extract_general_keywords(self, query: str) -> List[str]:
+        """일반 키워드 추출"""
+        return list(_extract_general_keywords(query))
     
     def get_extractor_name(self) -> str:
         return self.extractor_name
@@ -125,9 +185,13 @@ class DomainKeywordExtractor(KeywordExtractor):
     def update_config(self, new_config: dict):
         """설정 업데이트"""
         self.config.update(new_config)
+        with self._keyword_cache_lock:
+            self._keyword_cache.clear()
         logging.info(f"도메인 추출기 설정 업데이트: {new_config}")
     
     def add_domain_terms(self, domain: str, terms: Dict[str, List[str]]):
         """새로운 도메인 용어 추가"""
         self.domain_terms[domain] = terms
+        with self._keyword_cache_lock:
+            self._keyword_cache.clear()
         logging.info(f"도메인 '{domain}' 용어 추가")
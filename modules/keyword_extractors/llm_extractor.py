@@ -4,10 +4,53 @@ LLM 기반 키워드 추출기
 """
 
 import re
+import json
+import time
+import sqlite3
+import hashlib
 import logging
+import threading
+from contextlib import closing
+from pathlib import Path
 from typing import List, Optional
 from .base_extractor import KeywordExtractor
 
+# 한글 또는 영문자가 하나라도 있는지 확인 (특수 문자만 있는 키워드 제외)
+_LETTER_RE = re.compile(r'[가-힣a-zA-Z]')
+# 공백을 제외한 첫 글자가 '#'나 '-'가 아닌 줄 (빈 줄 제외)
+_KEYWORD_LINE_RE = re.compile(r'^[^\S\n]*([^\s#\-].*)$', re.MULTILINE)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# 키워드 생성 프롬프트 템플릿 ({query}, {max_keywords} 치환)
+_ADVANCED_PROMPT = """
+당신은 한국 학술 연구 데이터베이스 'ScienceOn'의 검색 성능을 극대화하는 전문가입니다.
+사용자의 질문을 분석하여 ScienceOn API에서 효과적으로 검색할 수 있는 **작은 단위의 키워드들**을 생성하세요.
+
+질문: "{query}"
+
+요구사항:
+1. **학술적 정확성**: 연구 분야의 전문 용어와 개념을 정확히 반영
+2. **즉시 검색 가능**: ScienceOn API에서 바로 검색할 수 있는 형태
+3. **다양성**: 동일한 개념의 다양한 표현 방식 포함
+4. **구체성**: 너무 일반적이지 않은 구체적인 키워드
+
+키워드 생성 규칙:
+- 각 키워드는 한 줄에 하나씩
+- 불필요한 기호나 설명 없이 키워드만
+- 최대 {max_keywords}개
+- 한국어와 영어 모두 가능
+
+키워드:
+"""
+
+_SIMPLE_PROMPT = """
+다음 질문에서 검색에 유용한 키워드 {max_keywords}개를 추출해주세요.
+
+질문: "{query}"
+
+키워드 (한 줄에 하나씩):
+"""
+
 class LLMKeywordExtractor(KeywordExtractor):
     """LLM 기반 키워드 추출기"""
     
@@ -23,9 +66,22 @@ class LLMKeywordExtractor(KeywordExtractor):
         self.config = config or {
             'max_keywords': 5,
             'min_keyword_length': 2,
-            'use_advanced_prompt': True
+            'use_advanced_prompt': True,
+            'persistent_cache_path': None,      # 실행 간 키워드 캐시 sqlite 경로 (예: '../data/keyword_cache.db', None이면 사용 안 함)
+            'persistent_cache_ttl': 7 * 24 * 3600  # 실행 간 캐시 유지 시간 (초, None이면 만료 없음)
         }
         self.extractor_name = "llm_extractor"
+        self._init_persistent_cache()
+        
+        # 질문 -> (키워드, 저장 시각) 캐시 (같은 질문으로 Gemini를 반복 호출하지 않도록)
+        self._keyword_cache = {}
+        self._keyword_cache_lock = threading.Lock()  # 여러 질문의 키워드를 동시에 추출할 때 캐시 보호
+        self._cache_ttl = self.config.get('cache_ttl', 300)
+        self._cache_size = 512
+        
+        # Gemini 호출 실패 후 재시도를 미룰 시각 (실패가 반복될 때 매 질문마다 타임아웃을 기다리지 않도록)
+        self._failure_cooldown = self.config.get('failure_cooldown', 60)
+        self._disabled_until = 0.0
     
     def extract_keywords(self, query: str, **kwargs) -> List[str]:
         """
@@ -42,81 +98,172 @@ class LLMKeywordExtractor(KeywordExtractor):
             logging.warning("Gemini 클라이언트가 없습니다.")
             return []
         
+        cached = self._get_cached_keywords(query)
+        if cached is not None:
+            return cached
+        
+        cached = self._get_persistent_keywords(query)
+        if cached is not None:
+            self._cache_keywords(query, cached)
+            return cached
+        
+        if not self.is_available():
+            logging.debug("최근 LLM 키워드 추출 실패로 호출을 건너뜁니다.")
+            return []
+        
         try:
             # 고급 키워드 생성 프롬프트 사용
             prompt = self._create_keyword_generation_prompt(query)
             
-            response = self.gemini_client.generate_answer(prompt)
+            # 실패 시 안내 문구가 키워드로 파싱되지 않도록 예외로 받음 (아래 except에서 호출 중단)
+            response = self.gemini_client.generate_answer(prompt, raise_on_error=True)
             
             # 응답에서 키워드 추출
             keywords = self._parse_llm_response(response)
             
             logging.info(f"LLM 키워드 추출: {', '.join(keywords)}")
+            if keywords:
+                self._cache_keywords(query, keywords)
+                self._store_persistent_keywords(query, keywords)
             return keywords
             
         except Exception as e:
-            logging.error(f"LLM 키워드 추출 실패: {e}")
+            self._disabled_until = time.monotonic() + self._failure_cooldown
+            logging.error(f"LLM 키워드 추출 실패 ({self._failure_cooldown}초 동안 호출 중단): {e}")
             return []
     
-    def _create_keyword_generation_prompt(self, query: str) -> str:
-        """키워드 생성 프롬프트 생성"""
-        if self.config.get('use_advanced_prompt', True):
-            return self._create_advanced_prompt(query)
-        else:
-            return self._create_simple_prompt(query)
-    
-    def _create_advanced_prompt(self, query: str) -> str:
-        """고급 키워드 생성 프롬프트"""
-        return f"""
-당신은 한국 학술 연구 데이터베이스 'ScienceOn'의 검색 성능을 극대화하는 전문가입니다.
-사용자의 질문을 분석하여 ScienceOn API에서 효과적으로 검색할 수 있는 **작은 단위의 키워드들**을 생성하세요.
-
-질문: "{query}"
-
-요구사항:
-1. **학술적 정확성**: 연구 분야의 전문 용어와 개념을 정확히 반영
-2. **즉시 검색 가능**: ScienceOn API에서 바로 검색할 수 있는 형태
-3. **다양성**: 동일한 개념의 다양한 표현 방식 포함
-4. **구체성**: 너무 일반적이지 않은 구체적인 키워드
-
-키워드 생성 규칙:
-- 각 키워드는 한 줄에 하나씩
-- 불필요한 기호나 설명 없이 키워드만
-- 최대 {self.config['max_keywords']}개
-- 한국어와 영어 모두 가능
-
-키워드:
-"""
+    def is_available(self) -> bool:
+        """Gemini 호출 가능 여부 (클라이언트가 있고 실패 후 대기 시간이 지났는지)"""
+        return self.gemini_client is not None and time.monotonic() >= self._disabled_until
     
-    def _create_simple_prompt(self, query: str) -> str:
-        """간단한 키워드 생성 프롬프트"""
-        return f"""
-다음 질문에서 검색에 유용한 키워드 {self.config['max_keywords']}개를 추출해주세요.
-
-질문: "{query}"
-
-키워드 (한 줄에 하나씩):
-"""
+    def _get_cached_keywords(self, query: str) -> Optional[List[str]]:
+        """TTL 이내의 캐시된 키워드 반환"""
+        with self._keyword_cache_lock:
+            entry = self._keyword_cache.get(query)
+            if entry is None:
+                return None
+            
+            keywords, stored_at = entry
+            if time.monotonic() - stored_at > self._cache_ttl:
+                del self._keyword_cache[query]
+                return None
+        
+        return list(keywords)
+    
+    def _cache_keywords(self, query: str, keywords: List[str]):
+        """키워드 캐시 저장"""
+        with self._keyword_cache_lock:
+            if len(self._keyword_cache) >= self._cache_size:
+                self._keyword_cache.pop(next(iter(self._keyword_cache)))  # 가장 오래된 항목 제거
+            self._keyword_cache[query] = (tuple(keywords), time.monotonic())
+    
+    def _init_persistent_cache(self):
+        """실행 간 유지되는 키워드 캐시(sqlite) 준비 (실패 시 메모리 캐시만 사용)"""
+        path = self.config.get('persistent_cache_path')
+        self._persistent_cache_path = Path(path) if path else None
+        if self._persistent_cache_path is None:
+            return
+        
+        try:
+            self._persistent_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._connect_persistent_cache() as conn, conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS keyword_cache (
+                        cache_key TEXT PRIMARY KEY,
+                        keywords TEXT NOT NULL,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    )
+                """)
+                # 만료된 항목 정리
+                ttl = self.config.get('persistent_cache_ttl')
+                if ttl is not None:
+                    conn.execute(
+                        "DELETE FROM keyword_cache WHERE created_at < datetime('now', ?)",
+                        (f'-{int(ttl)} seconds',)
+                    )
+        except Exception as e:
+            logging.warning(f"키워드 캐시 DB 초기화 실패: {e}")
+            self._persistent_cache_path = None
+    
+    def _connect_persistent_cache(self):
+        """키워드 캐시 DB 연결 (with 블록이 끝나면 커밋 후 연결 종료)"""
+        return closing(sqlite3.connect(self._persistent_cache_path))
+    
+    def _persistent_cache_key(self, query: str) -> str:
+        """정규화한 질문(소문자, 공백 정리)과 프롬프트 설정으로 만든 캐시 키"""
+        normalized = _WHITESPACE_RE.sub(' ', query).strip().lower()
+        prompt_type = 'advanced' if self.config.get('use_advanced_prompt', True) else 'simple'
+        key_source = f"{prompt_type}|{self.config['max_keywords']}|{normalized}"
+        return hashlib.sha256(key_source.encode('utf-8')).hexdigest()
+    
+    def _get_persistent_keywords(self, query: str) -> Optional[List[str]]:
+        """키워드 캐시 DB 조회"""
+        if self._persistent_cache_path is None:
+            return None
+        
+        try:
+            ttl = self.config.get('persistent_cache_ttl')
+            with self._connect_persistent_cache() as conn:
+                if ttl is None:
+                    row = conn.execute(
+                        "SELECT keywords FROM keyword_cache WHERE cache_key = ?",
+                        (self._persistent_cache_key(query),)
+                    ).fetchone()
+                else:
+                    row = conn.execute(
+                        "SELECT keywords FROM keyword_cache WHERE cache_key = ? AND created_at >= datetime('now', ?)",
+                        (self._persistent_cache_key(query), f'-{int(ttl)} seconds')
+                    ).fetchone()
+        except Exception as e:
+            logging.warning(f"키워드 캐시 DB 조회 실패: {e}")
+            return None
+        
+        if row is None:
+            return None
+        
+        keywords = json.loads(row[0])
+        logging.info(f"LLM 키워드 캐시 사용: {', '.join(keywords)}")
+        return keywords
+    
+    def _store_persistent_keywords(self, query: str, keywords: List[str]):
+        """키워드 캐시 DB 저장 (Gemini 생성이 성공한 결과만 전달됨)"""
+        if self._persistent_cache_path is None:
+            return
+        
+        try:
+            with self._connect_persistent_cache() as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO keyword_cache (cache_key, keywords) VALUES (?, ?)",
+                    (self._persistent_cache_key(query), json.dumps(keywords, ensure_ascii=False))
+                )
+        except Exception as e:
+            logging.warning(f"키워드 캐시 DB 저장 실패: {e}")
+    
+    def _create_keyword_generation_prompt(self, query: str) -> str:
+        """키워드 생성 프롬프트 생성 (모듈 템플릿에 질문과 키워드 수만 채움)"""
+        template = _ADVANCED_PROMPT if self.config.get('use_advanced_prompt', True) else _SIMPLE_PROMPT
+        return template.format(query=query, max_keywords=self.config['max_keywords'])
     
     def _parse_llm_response(self, response: str) -> List[str]:
-        """LLM 응답에서 키워드 파싱"""
+        """
+        LLM 응답에서 키워드 파싱 (빈 줄/주석/목록 기호 줄은 정규식 단계에서 제외)
+        
+        중복 키워드는 건너뛰고, max_keywords개를 채우면 나머지 줄은 보지 않는다.
+        """
+        max_keywords = self.config['max_keywords']
         keywords = []
+        seen = set()
         
-        for line in response.strip().split('\n'):
-            line = line.strip()
-            
-            # 빈 줄이나 주석 제외
-            if not line or line.startswith('#') or line.startswith('-'):
-                continue
-            
-            # 불필요한 문자 제거
-            clean_keyword = self._clean_keyword(line)
+        for match in _KEYWORD_LINE_RE.finditer(response):
+            if len(keywords) >= max_keywords:
+                break
             
-            # 유효한 키워드인지 확인
-            if self._is_valid_keyword(clean_keyword):
+            clean_keyword = self._clean_keyword(match.group(1))
+            if clean_keyword not in seen and self._is_valid_keyword(clean_keyword):
+                seen.add(clean_keyword)
                 keywords.append(clean_keyword)
         
-        return keywords[:self.config['max_keywords']]
+        return keywords
     
     def _clean_keyword(self, keyword: str) -> str:
         """키워드 정리"""
@@ -143,7 +290,7 @@ class LLMKeywordExtractor(KeywordExtractor):
             return False
         
         # 특수 문자만 있는 경우 제외
-        if not re.search(r'[가-힣a-zA-Z]', keyword):
+        if not _LETTER_RE.search(keyword):
             return False
         
         return True
@@ -157,4 +304,10 @@ class LLMKeywordExtractor(KeywordExtractor):
     def update_config(self, new_config: dict):
         """설정 업데이트"""
         self.config.update(new_config)
+        self._cache_ttl = self.config.get('cache_ttl', self._cache_ttl)
+        self._failure_cooldown = self.config.get('failure_cooldown', self._failure_cooldown)
+        self._disabled_until = 0.0
+        self._keyword_cache.clear()
+        if 'persistent_cache_path' in new_config:
+            self._init_persistent_cache()
         logging.info(f"LLM 추출기 설정 업데이트: {new_config}")
@@ -0,0 +1,110 @@
+"""
+YAKE 기반 키워드 추출기
+- API 호출 없이 통계적 특징으로 n-gram 키워드 추출
+- LLM 추출 전에 시도하는 빠른 경로
+"""
+
+import logging
+from typing import List, Tuple
+from .base_extractor import KeywordExtractor
+from .basic_extractor import _is_korean
+
+class YakeKeywordExtractor(KeywordExtractor):
+    """YAKE 기반 키워드 추출기 (점수가 낮을수록 관련성이 높음)"""
+    
+    def __init__(self, config: dict = None):
+        """
+        YAKE 키워드 추출기 초기화
+        
+        Args:
+            config: 추출 설정
+        """
+        self.config = config or {
+            'max_keywords': 8,
+            'max_ngram_size': 3,
+            'dedup_threshold': 0.9,
+            'min_keywords': 3,      # 이보다 적으면 신뢰도 낮음
+            'max_top_score': 0.15   # 최상위 키워드 점수가 이보다 크면 신뢰도 낮음
+        }
+        self.extractor_name = "yake_extractor"
+        self._extractors = {}  # 언어 코드 -> yake.KeywordExtractor (최초 사용 시 생성)
+        self._available = True
+    
+    def extract_keywords(self, query: str, **kwargs) -> List[str]:
+        """
+        YAKE 키워드 추출
+        
+        Args:
+            query: 검색 쿼리
+            **kwargs: 추가 옵션
+        
+        Returns:
+            추출된 키워드 리스트
+        """
+        return [keyword for keyword, _ in self.extract_keywords_with_scores(query)]
+    
+    def extract_keywords_with_scores(self, query: str) -> List[Tuple[str, float]]:
+        """
+        점수와 함께 키워드 추출
+        
+        Args:
+            query: 검색 쿼리
+        
+        Returns:
+            (키워드, 점수) 튜플 리스트 (점수 오름차순)
+        """
+        extractor = self._get_extractor('ko' if _is_korean(query) else 'en')
+        if extractor is None:
+            return []
+        
+        try:
+            scored = extractor.extract_keywords(query)
+        except Exception as e:
+            logging.warning(f"YAKE 키워드 추출 실패: {e}")
+            return []
+        
+        logging.info(f"YAKE 키워드 추출: {', '.join(keyword for keyword, _ in scored)}")
+        return scored
+    
+    def is_confident(self, scored_keywords: List[Tuple[str, float]]) -> bool:
+        """추출 결과를 그대로 검색에 써도 되는지 판단"""
+        if len(scored_keywords) < self.config['min_keywords']:
+            return False
+        
+        return min(score for _, score in scored_keywords) <= self.config['max_top_score']
+    
+    def _get_extractor(self, language: str):
+        """언어별 YAKE 추출기 반환 (yake 미설치 시 None)"""
+        if not self._available:
+            return None
+        
+        extractor = self._extractors.get(language)
+        if extractor is None:
+            try:
+                import yake
+            except ImportError:
+                logging.warning("yake가 설치되어 있지 않아 YAKE 키워드 추출을 건너뜁니다.")
+                self._available = False
+                return None
+            
+            extractor = yake.KeywordExtractor(
+                lan=language,
+                n=self.config['max_ngram_size'],
+                dedupLim=self.config['dedup_threshold'],
+                top=self.config['max_keywords']
+            )
+            self._extractors[language] = extractor
+        
+        return extractor
+    
+    def get_extractor_name(self) -> str:
+        return self.extractor_name
+    
+    def get_config(self) -> dict:
+        return self.config.copy()
+    
+    def update_config(self, new_config: dict):
+        """설정 업데이트"""
+        self.config.update(new_config)
+        self._extractors.clear()
+        logging.info(f"YAKE 추출기 설정 업데이트: {new_config}")
@@ -9,6 +9,10 @@ import re
 from typing import List, Dict
 from .config import PROMPT_CONFIG, ANSWER_CONFIG
 
+_KOREAN_RE = re.compile('[가-힣]')
+_LETTER_RE = re.compile('[a-zA-Z가-힣]')
+_WORD_RE = re.compile(r'\w+')
+
 class PromptEngineer:
     """프롬프트 엔지니어"""
     
@@ -306,8 +310,8 @@ class PromptEngineer:
         Returns:
             언어 코드 ('ko' 또는 'en')
         """
-        korean_chars = len(re.findall('[가-힣]', text))
-        total_chars = len(re.findall('[a-zA-Z가-힣]', text))
+        korean_chars = len(_KOREAN_RE.findall(text))
+        total_chars = len(_LETTER_RE.findall(text))
         
         if total_chars == 0:
             return 'en'  # 기본값
@@ -330,7 +334,7 @@ class PromptEngineer:
             return context
         
         # 질문 키워드 강조
-        query_keywords = re.findall(r'\w+', query.lower())
+        query_keywords = _WORD_RE.findall(query.lower())
         
         enhanced_context = context
         for keyword in query_keywords[:5]:  # 상위 5개 키워드만
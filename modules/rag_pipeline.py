@@ -8,12 +8,17 @@ RAG 파이프라인 메인 모듈 (개선된 버전)
 
 import sys
 import logging
-from typing import List, Dict, Tuple
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Tuple, Optional
+import numpy as np
 from .document_manager import DocumentManager
 from .search_engine import FlexibleSearchEngine
 from .search_tools import ScienceONTool
 from .search_methods import KeywordSearchMethod, HybridSearchMethod, SemanticSearchMethod
-from .keyword_extractors import LLMKeywordExtractor, BasicKeywordExtractor
+from .keyword_extractors import LLMKeywordExtractor, BasicKeywordExtractor, YakeKeywordExtractor
+from .keyword_extractors.basic_extractor import _is_korean
 from .reranking import DocumentReranker
 from .answer_generator import AnswerGenerator
 from .config import SEARCH_CONFIG, ANSWER_CONFIG, TEST_CONFIG
@@ -56,21 +61,32 @@ class RAGPipeline:
         # 키워드 추출기들 초기화
         self.keyword_extractors = {
             'llm': LLMKeywordExtractor(gemini_client),
-            'basic': BasicKeywordExtractor()
+            'basic': BasicKeywordExtractor(),
+            'yake': YakeKeywordExtractor()
         }
         
         self.reranker = DocumentReranker()
         self.answer_generator = AnswerGenerator(gemini_client)
         
+        # 유사 질문 LLM 키워드 캐시 (고정 크기 링 버퍼: 임베딩 행렬의 i번째 행 <-> i번째 키워드)
+        self._keyword_cache_lock = threading.Lock()
+        self._keyword_cache_size = SEARCH_CONFIG.get('keyword_cache_size', 512)
+        self._keyword_cache_matrix: Optional[np.ndarray] = None  # 첫 저장 시 임베딩 차원으로 할당
+        self._keyword_cache_keywords: List[Optional[Tuple[str, ...]]] = [None] * self._keyword_cache_size
+        self._keyword_cache_count = 0  # 채워진 행 수
+        self._keyword_cache_next = 0   # 다음에 덮어쓸 행 (가장 오래된 항목)
+        
         logging.info("✅ 향상된 RAG 파이프라인 초기화 완료")
     
-    def process_question(self, question_id: int, query: str) -> Tuple[str, List[str]]:
+    def process_question(self, question_id: int, query: str,
+                         keywords: List[str] = None) -> Tuple[str, List[str]]:
         """
         단일 질문 처리 (전체 RAG 워크플로우)
         
         Args:
             question_id: 질문 ID
             query: 질문 내용
+            keywords: 미리 추출한 검색 키워드 (없으면 직접 추출)
             
         Returns:
             (답변, 논문 정보 리스트) 튜플
@@ -79,13 +95,14 @@ class RAGPipeline:
         
         try:
             # 1단계: 문서 검색
-            documents = self._retrieve_documents(query)
-            print(f"   📚 검색된 문서: {len(documents)}개")
+            documents = self._retrieve_documents(query, keywords=keywords)
             
-            # 2단계: 벡터 DB에 저장
+            # 2단계: 벡터 DB에 저장 (검색/저장 결과는 한 번에 출력)
             added_count = self.document_manager.store_documents(documents, query)
+            status = f"   📚 검색된 문서: {len(documents)}개"
             if added_count > 0:
-                print(f"   📚 벡터 DB에 {added_count}개 문서 추가")
+                status += f"\n   📚 벡터 DB에 {added_count}개 문서 추가"
+            print(status)
             
             # 3단계: 벡터 검색
             similar_docs = self.document_manager.search_similar_documents(query)
@@ -99,11 +116,12 @@ class RAGPipeline:
             # 6단계: 답변 생성용 상위 문서 선택
             context_docs = self.reranker.get_top_documents(reranked_docs)
             
-            # 7단계: 답변 생성
-            answer = self.answer_generator.generate_quality_answer(query, context_docs)
-            
-            # 8단계: 논문 정보 형식화
-            articles = self._format_articles(reranked_docs)
+            # 7-8단계: 답변 생성(LLM)과 논문 정보 형식화(문서 부족 시 추가 API 검색)는 서로 독립적이므로
+            #         형식화는 보조 스레드에서, 답변 생성은 현재 스레드에서 동시에 진행
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                articles_future = executor.submit(self._format_articles, reranked_docs)
+                answer = self.answer_generator.generate_quality_answer(query, context_docs)
+                articles = articles_future.result()
             
             return answer, articles
             
@@ -111,19 +129,27 @@ class RAGPipeline:
             print(f"   ❌ 질문 {question_id+1} 처리 실패: {e}")
             return f"처리 중 오류가 발생했습니다: {str(e)}", [''] * 50
     
-    def _retrieve_documents(self, query: str, search_strategy: str = None) -> List[Dict]:
+    def _retrieve_documents(self, query: str, search_strategy: str = None,
+                            keywords: List[str] = None) -> List[Dict]:
         """
         문서 검색 (향상된 검색 시스템 사용)
         
         Args:
             query: 검색 쿼리
             search_strategy: 검색 전략
+            keywords: 미리 추출한 검색 키워드 (없으면 직접 추출)
             
         Returns:
             검색된 문서 리스트
         """
         # 키워드 추출
-        keywords = self.keyword_extractors['llm'].extract_keywords(query)
+        if keywords is None:
+            keywords = self._extract_search_keywords(query)
+        
+        # 키워드 통계는 DEBUG 로그가 켜져 있을 때만 계산 (기본 출력은 변경 없음)
+        if keywords and logging.getLogger().isEnabledFor(logging.DEBUG):
+            average_length = sum(map(len, keywords)) / len(keywords)
+            logging.debug(f"검색 키워드 {len(keywords)}개 (평균 {average_length:.1f}자): {', '.join(keywords)}")
         
         # 검색 실행
         documents, search_metadata = self.search_engine.search(
@@ -135,6 +161,94 @@ class RAGPipeline:
         
         return documents
     
+    def _extract_search_keywords(self, query: str) -> List[str]:
+        """
+        검색 키워드 추출 (영어 질문은 YAKE 우선, 신뢰도가 낮으면 LLM, LLM을 쓸 수 없으면 기본 추출기)
+        
+        Args:
+            query: 검색 쿼리
+            
+        Returns:
+            검색 키워드 리스트
+        """
+        # YAKE는 한국어를 형태소 단위로 나누지 못해 조사가 붙은 키워드("인공지능의")를 내므로 한국어 질문에는 사용하지 않음
+        if SEARCH_CONFIG.get('use_yake_keywords', False) and not _is_korean(query):
+            yake_extractor = self.keyword_extractors['yake']
+            scored_keywords = yake_extractor.extract_keywords_with_scores(query)
+            
+            if yake_extractor.is_confident(scored_keywords):
+                return [keyword for keyword, _ in scored_keywords]
+        
+        # LLM 사용 여부는 SEARCH_CONFIG['use_llm_keywords']로 설정
+        keywords = self._extract_llm_keywords(query) if SEARCH_CONFIG.get('use_llm_keywords', True) else []
+        if not keywords:
+            keywords = self.keyword_extractors['basic'].extract_keywords(query)
+        
+        return keywords
+    
+    def _extract_llm_keywords(self, query: str) -> List[str]:
+        """
+        LLM 키워드 추출 (keyword_cache_similarity 설정 시 의미상 거의 같은 이전 질문의 키워드를 재사용)
+        
+        Args:
+            query: 검색 쿼리
+            
+        Returns:
+            검색 키워드 리스트
+        """
+        # 유사 질문 캐시는 선택 사항 (임베딩 모델이 영어 전용이라 한국어 템플릿 질문끼리 쉽게 높은 유사도가 나옴)
+        similarity_threshold = SEARCH_CONFIG.get('keyword_cache_similarity')
+        if similarity_threshold is None:
+            return self.keyword_extractors['llm'].extract_keywords(query)
+        
+        try:
+            query_embedding = self.document_manager.get_query_embedding(query)
+        except Exception as e:
+            logging.warning(f"질문 임베딩 실패, 유사 질문 키워드 캐시를 건너뜁니다: {e}")
+            return self.keyword_extractors['llm'].extract_keywords(query)
+        
+        with self._keyword_cache_lock:
+            if self._keyword_cache_count:
+                similarities = self._keyword_cache_matrix[:self._keyword_cache_count] @ query_embedding
+                best = int(similarities.argmax())
+                if similarities[best] >= similarity_threshold:
+                    logging.info(f"유사 질문 키워드 재사용 (유사도 {similarities[best]:.3f})")
+                    return list(self._keyword_cache_keywords[best])
+        
+        keywords = self.keyword_extractors['llm'].extract_keywords(query)
+        if keywords:
+            # 가득 차면 가장 오래된 행을 덮어씀 (행렬 복사 없음)
+            with self._keyword_cache_lock:
+                if self._keyword_cache_matrix is None:
+                    self._keyword_cache_matrix = np.empty(
+                        (self._keyword_cache_size, query_embedding.shape[0]), dtype=np.float32
+                    )
+                
+                index = self._keyword_cache_next
+                self._keyword_cache_matrix[index] = query_embedding
+                self._keyword_cache_keywords[index] = tuple(keywords)
+                self._keyword_cache_next = (index + 1) % self._keyword_cache_size
+                self._keyword_cache_count = min(self._keyword_cache_count + 1, self._keyword_cache_size)
+        
+        return keywords
+    
+    def prefetch_keywords(self, queries: List[str]) -> List[List[str]]:
+        """
+        여러 질문의 검색 키워드를 동시에 추출 (LLM 호출 대기 시간을 질문 간에 겹침)
+        
+        Args:
+            queries: 질문 리스트
+            
+        Returns:
+            질문 순서대로의 키워드 리스트
+        """
+        max_workers = min(SEARCH_CONFIG.get('keyword_prefetch_workers', 4), len(queries))
+        if max_workers <= 1:
+            return [self._extract_search_keywords(query) for query in queries]
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self._extract_search_keywords, queries))
+    
     def _format_articles(self, documents: List[Dict]) -> List[str]:
         """
         문서를 Kaggle 형식으로 변환 (실제 50개 문서 보장)
@@ -149,8 +263,7 @@ class RAGPipeline:
         
         # 실제 문서가 50개 미만이면 추가 검색
         if len(documents) < 50:
-            print(f"   🚨 실제 문서 부족: {len(documents)}개 (목표: 50개)")
-            print(f"   🔍 추가 문서 검색 중...")
+            print(f"   🚨 실제 문서 부족: {len(documents)}개 (목표: 50개)\n   🔍 추가 문서 검색 중...")
             
             # 추가 검색을 위해 search_engine 사용
             additional_docs, _ = self.search_engine.search(
@@ -159,16 +272,17 @@ class RAGPipeline:
                 method="keyword",
                 keywords=["research", "study", "analysis"]
             )
-            documents.extend(additional_docs)
             
-            # 중복 제거
+            # 기존 문서와 추가 문서를 이어서 훑으며 중복 제거 (호출자 리스트는 수정하지 않고, 50개가 차면 중단)
             seen_ids = set()
             unique_docs = []
-            for doc in documents:
+            for doc in itertools.chain(documents, additional_docs):
                 doc_id = doc.get('CN')
                 if doc_id and doc_id not in seen_ids:
                     seen_ids.add(doc_id)
                     unique_docs.append(doc)
+                    if len(unique_docs) >= 50:
+                        break
             documents = unique_docs
             
             print(f"   📊 추가 검색 후: {len(documents)}개 문서")
@@ -226,8 +340,11 @@ class RAGPipeline:
         """
         results = []
         
-        for question_id, query in questions:
-            answer, articles = self.process_question(question_id, query)
+        # 키워드 추출(LLM 호출)은 질문끼리 독립적이므로 먼저 한꺼번에 동시 실행
+        keywords_list = self.prefetch_keywords([query for _, query in questions])
+        
+        for (question_id, query), keywords in zip(questions, keywords_list):
+            answer, articles = self.process_question(question_id, query, keywords=keywords)
             results.append((question_id, answer, articles))
         
         return results
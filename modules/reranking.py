@@ -6,22 +6,63 @@
 - 도메인별 최적화
 """
 
+import logging
 from typing import List, Dict, Tuple
+from functools import lru_cache
 import re
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.feature_extraction.text import HashingVectorizer
 from .config import ANSWER_CONFIG
 
+_WORD_RE = re.compile(r'\b\w+\b')
+_QUESTION_TITLE_RE = re.compile(r'^(?:how|what|why|when|where)', re.IGNORECASE)  # 질문형 제목
+
+# 키워드 추출 시 제외할 불용어
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
+    'how', 'what', 'why', 'when', 'where', 'which', 'who',
+    'can', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might'
+})
+
+# 도메인별 키워드 (도메인 추정용)
+DOMAIN_KEYWORDS = {
+    'computer_science': ['algorithm', 'neural', 'network', 'machine', 'learning', 'artificial', 'intelligence'],
+    'mathematics': ['mathematics', 'mathematical', 'equation', 'theorem', 'proof', 'calculation'],
+    'medicine': ['medical', 'clinical', 'patient', 'treatment', 'diagnosis', 'disease'],
+    'engineering': ['engineering', 'system', 'design', 'technology', 'implementation'],
+    'business': ['business', 'management', 'corporate', 'strategy', 'organization'],
+    'sustainability': ['sustainability', 'environmental', 'green', 'eco', 'climate']
+}
+
+# (키워드, 도메인) 평탄화 목록 - 도메인 순서를 유지하므로 처음 매칭된 키워드의 도메인이 곧 추정 결과
+_DOMAIN_TERMS = tuple(
+    (keyword, domain) for domain, keywords in DOMAIN_KEYWORDS.items() for keyword in keywords
+)
+
+
+@lru_cache(maxsize=4096)
+def _estimate_domain(text: str) -> str:
+    """텍스트의 도메인 추정 (같은 초록이 반복 재순위화되므로 캐싱)"""
+    text_lower = text.lower()
+    
+    for keyword, domain in _DOMAIN_TERMS:
+        if keyword in text_lower:
+            return domain
+    
+    return 'general'
+
 class DocumentReranker:
     """고급 문서 재순위화기 (대회 핵심 요구사항)"""
     
     def __init__(self):
         """재순위화기 초기화"""
-        self.tfidf_vectorizer = TfidfVectorizer(
-            max_features=1000,
+        # 어휘 사전을 만들지 않는 무상태 벡터화기 (L2 정규화 → 내적이 곧 코사인 유사도)
+        self.vectorizer = HashingVectorizer(
+            n_features=2**18,
             stop_words='english',
-            ngram_range=(1, 2)
+            ngram_range=(1, 2),
+            alternate_sign=False,
+            norm='l2'
         )
     
     def rerank_documents(self, documents: List[Dict], query: str, top_k: int = 50) -> List[Dict]:
@@ -36,15 +77,22 @@ class DocumentReranker:
         Returns:
             재순위화된 문서 리스트
         """
-        if not documents:
+        # 문서가 하나 이하면 정렬/다양성 필터링 모두 의미가 없음
+        if len(documents) <= 1:
             return documents
         
-        print(f"   🔄 고급 문서 재순위화 시작: {len(documents)}개 문서")
+        logging.info(f"고급 문서 재순위화 시작: {len(documents)}개 문서")
         
-        # 1. 다중 기준 관련성 점수 계산
+        # 1. 다중 기준 관련성 점수 계산 (질문 도메인/키워드/개념은 한 번만 추출)
+        query_domain = self._estimate_domain(query)
+        query_keywords = self._extract_keywords(query)
+        query_concepts = set(self._extract_concepts(query))
+        tfidf_scores = self._calculate_tfidf_scores(query, [self._document_text(doc) for doc in documents])
         scored_docs = []
-        for doc in documents:
-            relevance_score = self._calculate_relevance_score(query, doc)
+        for doc, tfidf_score in zip(documents, tfidf_scores):
+            relevance_score = self._calculate_relevance_score(
+                query, doc, query_domain, tfidf_score, query_keywords, query_concepts
+            )
             doc_with_score = doc.copy()
             doc_with_score['_relevance_score'] = relevance_score
             scored_docs.append(doc_with_score)
@@ -55,17 +103,23 @@ class DocumentReranker:
         # 3. 다양성 기반 필터링
         diverse_docs = self.filter_by_diversity(reranked_docs[:top_k*2])  # 2배로 확장 후 필터링
         
-        print(f"   ✅ 고급 재순위화 완료: 상위 {len(diverse_docs)}개 선택")
+        logging.info(f"고급 재순위화 완료: 상위 {len(diverse_docs)}개 선택")
         
         return diverse_docs[:top_k]
     
-    def _calculate_relevance_score(self, query: str, document: Dict) -> float:
+    def _calculate_relevance_score(self, query: str, document: Dict, query_domain: str = None,
+                                   tfidf_score: float = None, query_keywords: List[str] = None,
+                                   query_concepts: set = None) -> float:
         """
         질문과 문서 간의 관련성 점수 계산 (다중 기준)
         
         Args:
             query: 질문
             document: 문서
+            query_domain: 미리 추정한 질문 도메인 (없으면 계산)
+            tfidf_score: 일괄 계산한 TF-IDF 유사도 (없으면 계산)
+            query_keywords: 미리 추출한 질문 키워드 (없으면 계산)
+            query_concepts: 미리 추출한 질문 핵심 개념 집합 (없으면 계산)
             
         Returns:
             관련성 점수 (0.0 ~ 1.0)
@@ -73,21 +127,25 @@ class DocumentReranker:
         
         title = document.get('title', '')
         abstract = document.get('abstract', '')
+        # 소문자 변환은 문서당 한 번만 하고 각 점수 계산에서 공유
+        title_lower = title.lower()
+        abstract_lower = abstract.lower()
         
         # 1. TF-IDF 기반 유사도 (30%)
-        tfidf_score = self._calculate_tfidf_similarity(query, title + " " + abstract)
+        if tfidf_score is None:
+            tfidf_score = self._calculate_tfidf_similarity(query, title + " " + abstract)
         
         # 2. 키워드 매칭 점수 (25%)
-        keyword_score = self._calculate_keyword_matching(query, title, abstract)
+        keyword_score = self._calculate_keyword_matching(query, title_lower, abstract_lower, query_keywords)
         
         # 3. 제목 관련성 점수 (20%)
-        title_score = self._calculate_title_relevance(query, title)
+        title_score = self._calculate_title_relevance(query, title_lower, query_concepts)
         
         # 4. 문서 품질 점수 (15%)
         quality_score = self._calculate_document_quality(document)
         
         # 5. 컨텍스트 일관성 점수 (10%)
-        context_score = self._calculate_context_consistency(query, abstract)
+        context_score = self._calculate_context_consistency(query, abstract, query_domain)
         
         # 가중 평균 계산
         final_score = (
@@ -102,26 +160,37 @@ class DocumentReranker:
     
     def _calculate_tfidf_similarity(self, query: str, text: str) -> float:
         """TF-IDF 기반 유사도 계산"""
-        try:
-            # TF-IDF 벡터화
-            tfidf_matrix = self.tfidf_vectorizer.fit_transform([query, text])
-            
-            # 코사인 유사도 계산
-            similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-            
-            return float(similarity)
-        except:
+        vectors = self.vectorizer.transform([query, text])
+        
+        # 불용어만 있는 텍스트 등 토큰이 하나도 없으면 유사도 0
+        if vectors.nnz == 0:
             return 0.0
+        
+        # 정규화된 벡터의 내적 = 코사인 유사도
+        return float(vectors[0].multiply(vectors[1]).sum())
+    
+    def _calculate_tfidf_scores(self, query: str, texts: List[str]) -> np.ndarray:
+        """질문과 여러 문서 간의 유사도를 한 번의 행렬 곱으로 계산"""
+        vectors = self.vectorizer.transform([query] + texts)
+        if vectors.nnz == 0:
+            return np.zeros(len(texts))
+        return (vectors[1:] @ vectors[0].T).toarray().ravel()
+    
+    def _document_text(self, document: Dict) -> str:
+        """유사도 계산용 문서 텍스트"""
+        return document.get('title', '') + ' ' + document.get('abstract', '')
     
-    def _calculate_keyword_matching(self, query: str, title: str, abstract: str) -> float:
-        """키워드 매칭 점수 계산"""
+    def _calculate_keyword_matching(self, query: str, title_lower: str, abstract_lower: str,
+                                    query_keywords: List[str] = None) -> float:
+        """키워드 매칭 점수 계산 (제목/초록은 소문자로 변환된 텍스트)"""
         
-        # 질문에서 키워드 추출
-        query_keywords = self._extract_keywords(query)
+        # 질문에서 키워드 추출 (재순위화 시에는 미리 추출한 키워드 사용)
+        if query_keywords is None:
+            query_keywords = self._extract_keywords(query)
         
-        # 제목과 초록에서 키워드 매칭
-        title_matches = sum(1 for keyword in query_keywords if keyword.lower() in title.lower())
-        abstract_matches = sum(1 for keyword in query_keywords if keyword.lower() in abstract.lower())
+        # 제목과 초록에서 키워드 매칭 (키워드도 이미 소문자)
+        title_matches = sum(1 for keyword in query_keywords if keyword in title_lower)
+        abstract_matches = sum(1 for keyword in query_keywords if keyword in abstract_lower)
         
         # 가중 점수 계산
         title_score = title_matches / len(query_keywords) if query_keywords else 0
@@ -130,39 +199,34 @@ class DocumentReranker:
         # 제목 매칭에 더 높은 가중치
         return title_score * 0.7 + abstract_score * 0.3
     
-    def _calculate_title_relevance(self, query: str, title: str) -> float:
-        """제목 관련성 점수 계산"""
+    def _calculate_title_relevance(self, query: str, title_lower: str, query_concepts: set = None) -> float:
+        """제목 관련성 점수 계산 (제목은 소문자로 변환된 텍스트)"""
         
-        # 질문의 핵심 개념 추출
-        query_concepts = self._extract_concepts(query)
-        title_concepts = self._extract_concepts(title)
+        # 질문의 핵심 개념 추출 (재순위화 시에는 미리 추출한 개념 사용)
+        if query_concepts is None:
+            query_concepts = set(self._extract_concepts(query))
+        title_concepts = set(self._extract_concepts(title_lower, lowered=True))
         
         # 개념 매칭 계산
-        matches = len(set(query_concepts) & set(title_concepts))
-        total = len(set(query_concepts) | set(title_concepts))
+        matches = len(query_concepts & title_concepts)
+        total = len(query_concepts | title_concepts)
         
         return matches / total if total > 0 else 0.0
     
     def _extract_keywords(self, text: str) -> List[str]:
         """텍스트에서 키워드 추출"""
         # 간단한 키워드 추출
-        words = re.findall(r'\b\w+\b', text.lower())
+        words = _WORD_RE.findall(text.lower())
         
         # 불용어 제거
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
-            'how', 'what', 'why', 'when', 'where', 'which', 'who',
-            'can', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might'
-        }
-        
-        keywords = [word for word in words if word not in stop_words and len(word) > 2]
+        keywords = [word for word in words if word not in _STOP_WORDS and len(word) > 2]
         
         return keywords[:10]  # 상위 10개만
     
-    def _extract_concepts(self, text: str) -> List[str]:
-        """텍스트에서 핵심 개념 추출"""
+    def _extract_concepts(self, text: str, lowered: bool = False) -> List[str]:
+        """텍스트에서 핵심 개념 추출 (lowered=True면 이미 소문자인 텍스트로 간주)"""
         # 더 긴 단어들을 개념으로 간주
-        words = re.findall(r'\b\w+\b', text.lower())
+        words = _WORD_RE.findall(text if lowered else text.lower())
         concepts = [word for word in words if len(word) > 5]
         
         return concepts[:5]  # 상위 5개만
@@ -199,16 +263,17 @@ class DocumentReranker:
             quality_score += 0.2
         
         # 3. 제목 품질 점수 (질문어 제외)
-        if not any(title.lower().startswith(word) for word in ['how', 'what', 'why', 'when', 'where']):
+        if not _QUESTION_TITLE_RE.match(title):
             quality_score += 0.3
         
         return min(quality_score, 1.0)
     
-    def _calculate_context_consistency(self, query: str, abstract: str) -> float:
+    def _calculate_context_consistency(self, query: str, abstract: str, query_domain: str = None) -> float:
         """컨텍스트 일관성 점수 계산"""
         
         # 질문의 도메인 추정
-        query_domain = self._estimate_domain(query)
+        if query_domain is None:
+            query_domain = self._estimate_domain(query)
         abstract_domain = self._estimate_domain(abstract)
         
         # 도메인 일치도 계산
@@ -223,23 +288,7 @@ class DocumentReranker:
     
     def _estimate_domain(self, text: str) -> str:
         """텍스트의 도메인 추정"""
-        text_lower = text.lower()
-        
-        # 도메인별 키워드 매칭
-        domains = {
-            'computer_science': ['algorithm', 'neural', 'network', 'machine', 'learning', 'artificial', 'intelligence'],
-            'mathematics': ['mathematics', 'mathematical', 'equation', 'theorem', 'proof', 'calculation'],
-            'medicine': ['medical', 'clinical', 'patient', 'treatment', 'diagnosis', 'disease'],
-            'engineering': ['engineering', 'system', 'design', 'technology', 'implementation'],
-            'business': ['business', 'management', 'corporate', 'strategy', 'organization'],
-            'sustainability': ['sustainability', 'environmental', 'green', 'eco', 'climate']
-        }
-        
-        for domain, keywords in domains.items():
-            if any(keyword in text_lower for keyword in keywords):
-                return domain
-        
-        return 'general'
+        return _estimate_domain(text)
     
     def filter_by_diversity(self, documents: List[Dict], max_similar: float = 0.8) -> List[Dict]:
         """
@@ -253,34 +302,30 @@ class DocumentReranker:
             다양성이 보장된 문서 리스트
         """
         
-        if not documents:
-            return []
+        if len(documents) <= 1:
+            return list(documents)
         
-        diverse_docs = [documents[0]]  # 첫 번째 문서는 항상 포함
+        # 모든 문서 쌍의 유사도를 한 번에 계산
+        vectors = self.vectorizer.transform([self._document_text(doc) for doc in documents])
+        similarities = (vectors @ vectors.T).toarray()
         
-        for doc in documents[1:]:
-            # 기존 문서들과의 유사도 계산
-            max_similarity = 0.0
-            
-            for existing_doc in diverse_docs:
-                similarity = self._calculate_document_similarity(doc, existing_doc)
-                max_similarity = max(max_similarity, similarity)
-            
-            # 임계값보다 낮으면 추가
-            if max_similarity < max_similar:
-                diverse_docs.append(doc)
+        selected = [0]  # 첫 번째 문서는 항상 포함
         
-        print(f"   🌈 다양성 필터링: {len(documents)}개 → {len(diverse_docs)}개")
+        for i in range(1, len(documents)):
+            # 기존 문서들과의 최대 유사도가 임계값보다 낮으면 추가
+            if similarities[i, selected].max() < max_similar:
+                selected.append(i)
+        
+        diverse_docs = [documents[i] for i in selected]
+        
+        logging.info(f"다양성 필터링: {len(documents)}개 → {len(diverse_docs)}개")
         
         return diverse_docs
     
     def _calculate_document_similarity(self, doc1: Dict, doc2: Dict) -> float:
         """두 문서 간의 유사도 계산"""
         
-        text1 = doc1.get('title', '') + ' ' + doc1.get('abstract', '')
-        text2 = doc2.get('title', '') + ' ' + doc2.get('abstract', '')
-        
-        return self._calculate_tfidf_similarity(text1, text2)
+        return self._calculate_tfidf_similarity(self._document_text(doc1), self._document_text(doc2))
     
     def _final_ranking(self, documents: List[Dict]) -> List[Dict]:
         """최종 순위 조정"""
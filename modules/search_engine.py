@@ -8,8 +8,11 @@
 import hashlib
 import json
 import logging
+import time
+import threading
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime
+from .config import SEARCH_CONFIG
 
 class FlexibleSearchEngine:
     """통합 검색 엔진 (개선된 버전)"""
@@ -27,6 +30,12 @@ class FlexibleSearchEngine:
         self.default_tool = None
         self.default_method = None
         
+        # 검색 결과 캐시 (search_id -> (문서 리스트, 저장 시각)), 오래된 항목부터 제거
+        self._search_cache: "OrderedDict[str, Tuple[List[Dict], float]]" = OrderedDict()
+        self._cache_lock = threading.Lock()  # 여러 질문을 동시에 처리할 때 캐시 보호
+        self._cache_ttl = SEARCH_CONFIG.get('cache_ttl', 300)
+        self._cache_size = SEARCH_CONFIG.get('cache_size', 256)
+        
         logging.info("통합 검색 엔진 초기화 완료")
     
     def register_tool(self, tool_name: str, tool: Any, is_default: bool = False):
@@ -88,6 +97,20 @@ class FlexibleSearchEngine:
         # 검색 ID 생성
         search_id = self._generate_search_id(query, dataset_name, tool_name, method_name, kwargs)
         
+        # 동일한 검색이 TTL 내에 반복되면 캐시된 결과 반환 (검색 이력은 최초 실행 시에만 저장)
+        cached_documents = self._get_cached_result(search_id)
+        if cached_documents is not None:
+            logging.info(f"검색 캐시 적중: {search_id}")
+            return cached_documents, {
+                'search_id': search_id,
+                'tool': tool_name,
+                'method': method_name,
+                'search_time': 0.0,
+                'result_count': len(cached_documents),
+                'success': True,
+                'cached': True
+            }
+        
         # 검색 메타데이터 구성
         search_metadata = {
             'search_id': search_id,
@@ -100,8 +123,8 @@ class FlexibleSearchEngine:
             **kwargs
         }
         
-        # 검색 실행
-        start_time = datetime.now()
+        # 검색 실행 (단조 증가 고해상도 타이머로 측정)
+        start_time = time.perf_counter()
         
         try:
             search_method = self.methods[method_name]
@@ -109,7 +132,7 @@ class FlexibleSearchEngine:
                 query, self.tools, self.document_manager, search_metadata
             )
             
-            search_time = (datetime.now() - start_time).total_seconds()
+            search_time = time.perf_counter() - start_time
             
             # 검색 이력 저장
             self.document_manager.save_search_history(
@@ -124,6 +147,8 @@ class FlexibleSearchEngine:
                 success=True
             )
             
+            self._cache_result(search_id, documents)
+            
             return documents, {
                 'search_id': search_id,
                 'tool': tool_name,
@@ -134,7 +159,7 @@ class FlexibleSearchEngine:
             }
             
         except Exception as e:
-            search_time = (datetime.now() - start_time).total_seconds()
+            search_time = time.perf_counter() - start_time
             
             # 실패한 검색 이력 저장
             self.document_manager.save_search_history(
@@ -161,6 +186,37 @@ class FlexibleSearchEngine:
                 'error': str(e)
             }
     
+    def _get_cached_result(self, search_id: str) -> Optional[List[Dict]]:
+        """TTL 내의 캐시된 검색 결과 조회 (만료 시 제거)"""
+        with self._cache_lock:
+            entry = self._search_cache.get(search_id)
+            if entry is None:
+                return None
+            
+            documents, cached_at = entry
+            if time.monotonic() - cached_at > self._cache_ttl:
+                del self._search_cache[search_id]
+                return None
+            
+            self._search_cache.move_to_end(search_id)
+            return list(documents)
+    
+    def _cache_result(self, search_id: str, documents: List[Dict]):
+        """검색 결과 캐시 저장 (빈 결과는 저장하지 않음)"""
+        if not documents or self._cache_size <= 0:
+            return
+        
+        with self._cache_lock:
+            self._search_cache[search_id] = (list(documents), time.monotonic())
+            self._search_cache.move_to_end(search_id)
+            while len(self._search_cache) > self._cache_size:
+                self._search_cache.popitem(last=False)
+    
+    def clear_cache(self):
+        """검색 결과 캐시 초기화"""
+        with self._cache_lock:
+            self._search_cache.clear()
+    
     def _generate_search_id(self, query: str, dataset_name: str, 
                            tool: str, method: str, kwargs: Dict[str, Any]) -> str:
         """검색 ID 생성"""
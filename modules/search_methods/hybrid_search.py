@@ -4,9 +4,28 @@
 """
 
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
 from .base_method import SearchMethod
 
+try:
+    from datasketch import MinHash, MinHashLSH
+except ImportError:  # 미설치 시 정규화한 제목/초록 지문이 같은 문서만 중복으로 처리
+    MinHash = MinHashLSH = None
+
+_TOKEN_RE = re.compile(r'\w+')
+
+# 근사 중복 판단에 사용하는 제목+초록 앞부분 길이와 MinHash 순열 수
+NEAR_DUP_TEXT_LENGTH = 512
+NEAR_DUP_NUM_PERM = 64
+
+
+def _near_dup_tokens(doc: Dict) -> List[str]:
+    """근사 중복 판단용 토큰 (제목+초록 앞부분, 소문자)"""
+    text = f"{doc.get('title', '')} {doc.get('abstract', '')}"[:NEAR_DUP_TEXT_LENGTH]
+    return _TOKEN_RE.findall(text.lower())
+
 class HybridSearchMethod(SearchMethod):
     """하이브리드 검색 방법"""
     
@@ -21,7 +40,8 @@ class HybridSearchMethod(SearchMethod):
             'max_docs': 50,
             'keyword_weight': 0.6,
             'vector_weight': 0.4,
-            'similarity_threshold': 0.3
+            'similarity_threshold': 0.3,
+            'near_duplicate_threshold': 0.85  # MinHash 자카드 유사도 임계값
         }
         self.method_name = "hybrid_search"
     
@@ -39,18 +59,15 @@ class HybridSearchMethod(SearchMethod):
         Returns:
             검색된 문서 리스트
         """
-        all_documents = []
-        
-        # 1. 키워드 검색
-        keyword_docs = self._keyword_search(query, tools, document_manager, metadata)
-        all_documents.extend(keyword_docs)
+        # 1-2. 키워드 검색(API)과 벡터 검색(로컬 임베딩)은 서로 독립적이므로 동시에 실행
+        #      벡터 검색은 보조 스레드에서, 키워드 검색은 현재 스레드에서 진행
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            vector_future = executor.submit(self._vector_search, query, document_manager, metadata)
+            keyword_docs = self._keyword_search(query, tools, document_manager, metadata)
+            vector_docs = vector_future.result()
         
-        # 2. 벡터 검색
-        vector_docs = self._vector_search(query, document_manager, metadata)
-        all_documents.extend(vector_docs)
-        
-        # 3. 결과 병합 및 중복 제거
-        merged_docs = self._merge_documents(all_documents)
+        # 3. 결과 병합 및 중복 제거 (키워드 검색 결과 우선)
+        merged_docs = self._merge_documents(keyword_docs + vector_docs)
         
         # 4. 문서 저장
         if merged_docs:
@@ -86,17 +103,50 @@ class HybridSearchMethod(SearchMethod):
         )
     
     def _merge_documents(self, documents: List[Dict]) -> List[Dict]:
-        """문서 병합 및 중복 제거"""
-        seen_ids = set()
-        merged_docs = []
+        """문서 병합 및 중복 제거 (같은 ID + ID가 달라도 제목/초록이 거의 같은 문서)"""
+        # 문서 ID -> 문서 (삽입 순서 유지, 먼저 나온 문서 우선)
+        merged_docs = {}
         
         for doc in documents:
             doc_id = doc.get('CN') or doc.get('id')
-            if doc_id and doc_id not in seen_ids:
-                seen_ids.add(doc_id)
-                merged_docs.append(doc)
+            if doc_id:
+                merged_docs.setdefault(doc_id, doc)
         
-        return merged_docs
+        return self._remove_near_duplicates(list(merged_docs.values()))
+    
+    def _remove_near_duplicates(self, documents: List[Dict]) -> List[Dict]:
+        """제목/초록이 거의 같은 문서 제거 (datasketch 설치 시 MinHash LSH, 아니면 정규화 지문 비교)"""
+        if len(documents) < 2:
+            return documents
+        
+        unique_docs = []
+        
+        if MinHashLSH is None:
+            seen_fingerprints = set()
+            for doc in documents:
+                tokens = _near_dup_tokens(doc)
+                fingerprint = ' '.join(tokens)
+                if tokens and fingerprint in seen_fingerprints:
+                    continue
+                seen_fingerprints.add(fingerprint)
+                unique_docs.append(doc)
+        else:
+            threshold = self.config.get('near_duplicate_threshold', 0.85)
+            lsh = MinHashLSH(threshold=threshold, num_perm=NEAR_DUP_NUM_PERM)
+            for index, doc in enumerate(documents):
+                tokens = _near_dup_tokens(doc)
+                if tokens:
+                    signature = MinHash(num_perm=NEAR_DUP_NUM_PERM)
+                    signature.update_batch([token.encode('utf-8') for token in tokens])
+                    if lsh.query(signature):
+                        continue
+                    lsh.insert(str(index), signature)
+                unique_docs.append(doc)
+        
+        removed = len(documents) - len(unique_docs)
+        if removed:
+            logging.info(f"근사 중복 문서 제거: {removed}개")
+        return unique_docs
     
     def get_method_name(self) -> str:
         return self.method_name
@@ -3,11 +3,14 @@ ScienceON API 검색 도구
 - ScienceON API를 통한 문서 검색
 """
 
-import time
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any
 from .base_tool import SearchTool
 
+# 검색 요청마다 공유하는 요청 필드
+_SEARCH_FIELDS = ('title', 'abstract', 'CN')
+
 class ScienceONTool(SearchTool):
     """ScienceON API 검색 도구"""
     
@@ -23,9 +26,9 @@ class ScienceONTool(SearchTool):
         self.config = config or {
             'min_docs': 50,
             'max_retries': 3,
-            'api_delay': 0.3,
+            'max_concurrency': 4,  # 동시에 진행할 최대 요청 수
             'row_count_per_keyword': 25,
-            'required_fields': ['title', 'abstract', 'CN']
+            'required_fields': _SEARCH_FIELDS
         }
         self.tool_name = "scienceon"
     
@@ -33,6 +36,10 @@ class ScienceONTool(SearchTool):
         """
         ScienceON API를 통한 문서 검색
         
+        키워드별 요청을 스레드 풀에서 동시에 보내되, 동시 요청 수는
+        max_concurrency로 제한한다. 요청 시작 간격은 API 클라이언트의
+        rate limiter(api_delay)가 모든 스레드에 걸쳐 유지한다.
+        
         Args:
             keywords: 검색 키워드 리스트
             max_docs: 최대 문서 수
@@ -40,44 +47,61 @@ class ScienceONTool(SearchTool):
         Returns:
             검색된 문서 리스트
         """
-        all_docs = []
-        
-        for keyword in keywords:
-            try:
-                docs = self.api_client.search_articles(
-                    keyword, 
-                    row_count=self.config['row_count_per_keyword'],
-                    fields=self.config['required_fields']
-                )
-                all_docs.extend(docs)
-                logging.info(f"ScienceON 키워드 '{keyword}'로 {len(docs)}개 문서 검색")
-                time.sleep(self.config['api_delay'])
-                
-                if len(all_docs) >= max_docs:
-                    break
-                    
-            except Exception as e:
-                logging.warning(f"ScienceON 키워드 '{keyword}' 검색 실패: {e}")
-                continue
-        
-        # 중복 제거
-        unique_docs = self._remove_duplicates(all_docs)
+        unique_docs = self._search_keywords_concurrently(keywords, max_docs)
         
-        logging.info(f"ScienceON 검색 완료: {len(unique_docs)}개 문서")
+        logging.info(f"ScienceON 검색 완료: 키워드 {len(keywords)}개, {len(unique_docs)}개 문서")
         return unique_docs[:max_docs]
     
-    def _remove_duplicates(self, documents: List[Dict]) -> List[Dict]:
-        """중복 문서 제거"""
-        seen_ids = set()
-        unique_docs = []
+    def _search_keyword(self, keyword: str) -> List[Dict]:
+        """단일 키워드 검색 (실패 시 빈 리스트)"""
+        try:
+            docs = self.api_client.search_articles(
+                keyword,
+                row_count=self.config['row_count_per_keyword'],
+                fields=self.config['required_fields']
+            )
+        except Exception as e:
+            logging.warning(f"ScienceON 키워드 '{keyword}' 검색 실패: {e}")
+            return []
+        
+        # 키워드별 결과는 디버그 로그로만 남김 (요약은 search_documents에서 한 줄로 출력)
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(f"ScienceON 키워드 '{keyword}'로 {len(docs)}개 문서 검색")
+        return docs
+    
+    def _search_keywords_concurrently(self, keywords: List[str], max_docs: int) -> List[Dict]:
+        """키워드 검색을 동시에 실행하고 중복 없는 결과를 키워드 순서대로 반환"""
+        if not keywords:
+            return []
+        
+        max_workers = max(1, min(self.config.get('max_concurrency', 4), len(keywords)))
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        futures = {executor.submit(self._search_keyword, keyword): index
+                   for index, keyword in enumerate(keywords)}
+        results = {}
+        seen_ids = set()  # 도착한 결과의 고유 CN (종료 조건 판단용)
+        
+        try:
+            for future in as_completed(futures):
+                docs = future.result()
+                results[futures[future]] = docs
+                seen_ids.update(doc.get('CN') for doc in docs if doc.get('CN'))
+                
+                if len(seen_ids) >= max_docs:
+                    break
+        finally:
+            # 충분한 문서를 모으면 아직 시작하지 않은 요청은 취소 (진행 중인 요청은 기다리지 않음)
+            executor.shutdown(wait=False, cancel_futures=True)
         
-        for doc in documents:
-            doc_id = doc.get('CN')
-            if doc_id and doc_id not in seen_ids:
-                seen_ids.add(doc_id)
-                unique_docs.append(doc)
+        # 키워드 순서대로 CN 기준 첫 문서만 유지
+        unique_docs = {}
+        for index in sorted(results):
+            for doc in results[index]:
+                doc_id = doc.get('CN')
+                if doc_id and doc_id not in unique_docs:
+                    unique_docs[doc_id] = doc
         
-        return unique_docs
+        return list(unique_docs.values())
     
     def get_tool_name(self) -> str:
         return self.tool_name
@@ -1,10 +1,12 @@
 import os
-import re
 import json
 import base64
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from threading import Lock
 import xml.etree.ElementTree as ET
@@ -31,6 +33,32 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 BASE_URL = "https://apigateway.kisti.re.kr/openapicall.do"
 TOKEN_REQUEST_URL = "https://apigateway.kisti.re.kr/tokenrequest.do"
 TOKEN_EXPIRY_BUFFER = timedelta(minutes=1)
+DEFAULT_SEARCH_FIELDS = ('title', 'author', 'abstract', 'CN')
+# Field name -> XML item attributes identifying it in the search response.
+FIELD_MAP = {
+    'CN': {'metaCode': 'CN'},
+    'title': {'metaName': '논문명'},
+    'abstract': {'metaName': '초록'},
+    'author': {'metaName': '저자'},
+    'link': {'metaName': 'ScienceON상세링크'},
+    'publisher': {'metaName': '출판사(발행기관)'},
+    'journal': {'metaName': '저널명'},
+    'year': {'metaName': '발행년'}
+}
+
+@lru_cache(maxsize=32)
+def _field_lookup(fields: tuple) -> tuple:
+    """
+    Builds ((attribute, {attribute value: field name}), ...) for the requested
+    fields, grouped by attribute in FIELD_MAP order, so each <item> is matched
+    with a couple of dict lookups instead of testing every field's criteria.
+    """
+    lookup = {}
+    for field_name, criteria in FIELD_MAP.items():
+        if field_name in fields:
+            (attribute, value), = criteria.items()
+            lookup.setdefault(attribute, {}).setdefault(value, field_name)
+    return tuple(lookup.items())
 
 class AESCipher:
     """A consolidated class for handling AES-CBC encryption."""
@@ -110,7 +138,7 @@ class CredentialManager:
     def _request_new_tokens(self, session: requests.Session):
         """Requests new access and refresh tokens using the API key."""
         logging.info("Requesting new access/refresh tokens.")
-        current_time_str = ''.join(re.findall(r"\d", datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
+        current_time_str = datetime.now().strftime('%Y%m%d%H%M%S')
         plaintext_payload = json.dumps({"datetime": current_time_str, "mac_address": self.mac_address}).replace(" ", "")
 
         # Use the consolidated AESCipher class
@@ -146,11 +174,61 @@ class CredentialManager:
             
             return self.access_token
 
+class _RateLimiter:
+    """
+    Thread-safe token bucket for search requests.
+
+    Tokens refill at one per `min_interval` seconds up to `burst`, so idle time
+    (e.g. while earlier responses are still in flight) is credited instead of
+    sleeping unconditionally. A caller that finds the bucket empty reserves the
+    next token under the lock and sleeps outside of it.
+    """
+    def __init__(self, min_interval: float = 0.0, burst: int = 1):
+        self.min_interval = max(0.0, min_interval)
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = Lock()
+
+    def wait(self):
+        """Takes one token, blocking only while the bucket is empty."""
+        if self.min_interval <= 0:
+            return
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) / self.min_interval)
+            self._updated = now
+            self._tokens -= 1
+            # Negative tokens are reservations: wait until this one refills
+            delay = -self._tokens * self.min_interval
+        if delay > 0:
+            time.sleep(delay)
+
+
 class ScienceONAPIClient:
     """A synchronous client for the ScienceON API."""
-    def __init__(self, credentials_path: Path):
+    def __init__(self, credentials_path: Path, api_delay: float = 0.0, api_burst: int = 1,
+                 pool_maxsize: int = 16):
+        """
+        :param credentials_path: Path to the ScienceON credentials JSON file.
+        :param api_delay: Average spacing in seconds between search requests,
+                          shared by every thread using this client (0 disables it).
+        :param api_burst: Number of requests that may start back-to-back after
+                          an idle period before api_delay spacing applies.
+        :param pool_maxsize: Keep-alive connections kept per host, so concurrent
+                             searches reuse TLS connections instead of reconnecting.
+        """
         self.credential_manager = CredentialManager(credentials_path)
         self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=pool_maxsize,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=(502, 503, 504),
+                              allowed_methods=frozenset(['GET']))
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.rate_limiter = _RateLimiter(api_delay, api_burst)
 
     def close_session(self):
         """Closes the requests session."""
@@ -161,30 +239,21 @@ class ScienceONAPIClient:
         """Parses the API XML response to extract specified fields."""
         root = ET.fromstring(xml_text)
         records = []
-        field_map = {
-            'CN': {'metaCode': 'CN'},
-            'title': {'metaName': '논문명'},
-            'abstract': {'metaName': '초록'},
-            'author': {'metaName': '저자'},
-            'link': {'metaName': 'ScienceON상세링크'},
-            'publisher': {'metaName': '출판사(발행기관)'},
-            'journal': {'metaName': '저널명'},
-            'year': {'metaName': '발행년'}
-        }
-        
-        requested_fields = {k: v for k, v in field_map.items() if k in fields}
+        field_lookup = _field_lookup(tuple(fields))
         
         record_list = root.find('recordList')
         if record_list is None:
             return records
 
-        for record in record_list.findall('record'):
+        for record in record_list.iterfind('record'):
             record_dict = {}
-            for item in record.findall('item'):
-                text = item.text.strip() if item.text else ""
-                for field_name, criteria in requested_fields.items():
-                    if all(item.attrib.get(k) == v for k, v in criteria.items()):
-                        record_dict[field_name] = text
+            for item in record.iterfind('item'):
+                attrib = item.attrib
+                for attribute, field_names in field_lookup:
+                    field_name = field_names.get(attrib.get(attribute))
+                    if field_name is not None:
+                        text = item.text
+                        record_dict[field_name] = text.strip() if text else ""
                         break
             if record_dict:
                 records.append(record_dict)
@@ -204,7 +273,7 @@ class ScienceONAPIClient:
         :return: A list of dictionaries containing the search results.
         """
         if fields is None:
-            fields = ['title', 'author', 'abstract', 'CN']
+            fields = DEFAULT_SEARCH_FIELDS
 
         access_token = self.credential_manager.get_access_token(self.session)
         
@@ -223,6 +292,7 @@ class ScienceONAPIClient:
             'grouping': ''
         }
 
+        self.rate_limiter.wait()
         try:
             with self.session.get(BASE_URL, params=params) as response:
                 response.raise_for_status()
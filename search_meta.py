@@ -7,20 +7,52 @@
 """
 
 import os
+import re
+import csv
+import argparse
 import json
 import logging
 import pandas as pd
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import google.generativeai as genai
 
 # 기존 ScienceON API 클라이언트 import
 from scienceon_api_example import ScienceONAPIClient
+from modules.config import SEARCH_CONFIG
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# 페이지당 동시에 보낼 최대 검색 요청 수
+MAX_SEARCH_WORKERS = 8
+
+# 동시에 처리할 최대 질문 수 (질문마다 다시 MAX_SEARCH_WORKERS개의 검색을 보냄)
+MAX_QUERY_WORKERS = 4
+
+# 'full' 모드에서 test.csv에서 처리할 질문 수 (None이면 전체)
+MAX_TEST_QUESTIONS = 3
+
+# 질문별 검색 계획(키워드, 검색어)을 보관할 최대 개수
+MAX_QUERY_PLANS = 128
+
+# CSV 변환 시 논문 정보 컬럼 (질문당 최대 50개)
+_ARTICLE_COLUMNS = tuple(f'Prediction_retrieved_article_name_{i}' for i in range(1, 51))
+_CSV_FIELDNAMES = ('Question',) + _ARTICLE_COLUMNS
+
+# 검색어 정리용 정규식 (호출마다 컴파일하지 않도록 모듈 로드 시 한 번만 컴파일)
+_LIST_NUMBER_RE = re.compile(r'^\d+\.\s*')
+_PIPE_RUN_RE = re.compile(r'\|+')
+_ASCII_LETTER_RE = re.compile('[A-Za-z]')
+# LLM 키워드 응답의 '한국어: ...' / '영어: ...' 줄
+_KEYWORD_LANG_LINE_RE = re.compile(r'^[^\S\n]*(한국어|영어):(.*)$', re.MULTILINE)
+# 검색어 응답에서 건너뛸 설명 줄 머리말
+_QUERY_SKIP_PREFIXES = ('검색어:', '예:', '다음은', 'ScienceON', '규칙:', '질문:', '한국어 키워드:', '영어 키워드:')
+
 class KeywordExtractor:
     """LLM을 사용한 키워드 추출기"""
     
@@ -96,23 +128,12 @@ class KeywordExtractor:
             if response_text.startswith("키워드:"):
                 response_text = response_text[4:].strip()
             
-            # 한국어와 영어 키워드 분리
-            korean_keywords = []
-            english_keywords = []
-            
-            lines = response_text.split('\n')
-            for line in lines:
-                line = line.strip()
-                if line.startswith('한국어:'):
-                    korean_text = line.replace('한국어:', '').strip()
-                    korean_keywords = [kw.strip() for kw in korean_text.split(',') if kw.strip()]
-                elif line.startswith('영어:'):
-                    english_text = line.replace('영어:', '').strip()
-                    english_keywords = [kw.strip() for kw in english_text.split(',') if kw.strip()]
+            # 한국어와 영어 키워드 줄을 한 번에 찾아 분리 (같은 언어가 여러 번 나오면 마지막 줄 사용)
+            keyword_lines = dict(_KEYWORD_LANG_LINE_RE.findall(response_text))
             
-            # 빈 키워드 제거 및 길이 제한
-            korean_keywords = [kw for kw in korean_keywords if kw and 1 < len(kw) <= 30]
-            english_keywords = [kw for kw in english_keywords if kw and 1 < len(kw) <= 30]
+            # 공백 정리, 빈 키워드 제거 및 길이 제한
+            korean_keywords = [kw for kw in map(str.strip, keyword_lines.get('한국어', '').split(',')) if 1 < len(kw) <= 30]
+            english_keywords = [kw for kw in map(str.strip, keyword_lines.get('영어', '').split(',')) if 1 < len(kw) <= 30]
 
             result = {
                 'korean': korean_keywords,
@@ -145,7 +166,6 @@ class SearchQueryGenerator:
     
     def _init_gemini(self, api_key: str, model_name: str):
         """Gemini 모델 초기화"""
-        import google.generativeai as genai
         genai.configure(api_key=api_key)
         return genai.GenerativeModel(model_name)
     
@@ -205,24 +225,14 @@ class SearchQueryGenerator:
                 line = line.strip()
                 
                 # 설명적인 텍스트나 빈 줄 제외
-                if (not line or 
-                    line.startswith('검색어:') or 
-                    line.startswith('예:') or
-                    line.startswith('다음은') or
-                    line.startswith('ScienceON') or
-                    line.startswith('규칙:') or
-                    line.startswith('질문:') or
-                    line.startswith('한국어 키워드:') or
-                    line.startswith('영어 키워드:') or
-                    len(line) < 3):
+                if len(line) < 3 or line.startswith(_QUERY_SKIP_PREFIXES):
                     continue
                 
                 # 번호나 기호 제거
                 clean_line = line
                 
                 # 번호 패턴 제거 (1., 2., 10., 11. 등)
-                import re
-                clean_line = re.sub(r'^\d+\.\s*', '', clean_line)
+                clean_line = _LIST_NUMBER_RE.sub('', clean_line)
                 
                 # 기호 제거
                 if clean_line.startswith(('-', '•', '.', '`')):
@@ -231,9 +241,6 @@ class SearchQueryGenerator:
                 # 백틱 제거
                 clean_line = clean_line.replace('`', '').strip()
                 
-                # 따옴표 정리 - 원본 유지
-                clean_line = clean_line.replace('"', '"').replace('"', '"')
-                
                 if clean_line and len(clean_line) <= 100 and not clean_line.startswith('다음은'):
                     search_queries.append(clean_line)
             
@@ -246,21 +253,15 @@ class SearchQueryGenerator:
                     processed_query = query
                 
                 # 연속된 '|'를 하나로 줄이기
-                import re
-                processed_query = re.sub(r'\|+', '|', processed_query)
+                processed_query = _PIPE_RUN_RE.sub('|', processed_query)
                 
                 # 앞뒤의 '|' 제거
                 processed_query = processed_query.strip('|')
                 
                 processed_queries.append(processed_query)
             
-            # 중복 제거
-            unique_queries = []
-            seen = set()
-            for query in processed_queries:
-                if query not in seen:
-                    unique_queries.append(query)
-                    seen.add(query)
+            # 순서를 유지하며 중복 제거
+            unique_queries = list(dict.fromkeys(processed_queries))
             
             logging.info(f"Gemini가 생성한 검색어: {unique_queries}")
             return unique_queries[:8]  # 최대 8개로 제한
@@ -285,8 +286,58 @@ class SearchMetaGenerator:
             scienceon_credentials_path: ScienceON API 자격증명 파일 경로
         """
         self.keyword_extractor = KeywordExtractor(gemini_api_key)
-        self.scienceon_client = ScienceONAPIClient(Path(scienceon_credentials_path))
+        # 동시에 처리하는 질문들의 검색이 모두 keep-alive 연결을 재사용하고, 제출 파이프라인과 같은 간격으로 요청하도록 설정
+        self.scienceon_client = ScienceONAPIClient(
+            Path(scienceon_credentials_path),
+            api_delay=SEARCH_CONFIG['api_delay'],
+            api_burst=SEARCH_CONFIG.get('api_burst', 1),
+            pool_maxsize=MAX_QUERY_WORKERS * MAX_SEARCH_WORKERS
+        )
         self.query_generator = SearchQueryGenerator(gemini_api_key)
+        # 질문 -> (한국어 키워드, 영어 키워드, 검색어, API용 검색어), 같은 질문 재처리 시 LLM 호출 생략
+        self._query_plans: "OrderedDict[str, Tuple[Tuple[str, ...], ...]]" = OrderedDict()
+        self._query_plans_lock = threading.Lock()  # 여러 질문을 동시에 처리할 때 계획 캐시 보호
+    
+    def _plan_query(self, query: str) -> Tuple[Tuple[str, ...], ...]:
+        """
+        질문의 검색 계획을 한 번만 계산해 재사용
+        
+        Args:
+            query: 검색할 질문
+            
+        Returns:
+            (한국어 키워드, 영어 키워드, 검색어, API용 검색어) 튜플
+        """
+        with self._query_plans_lock:
+            plan = self._query_plans.get(query)
+            if plan is not None:
+                self._query_plans.move_to_end(query)
+        if plan is not None:
+            logging.info("이전에 만든 검색 계획 재사용")
+            return plan
+        
+        # 1. 키워드 추출
+        keywords_dict = self.keyword_extractor.extract_keywords(query)
+        
+        # 2. 검색어 생성 (Gemini 활용)
+        search_queries = self.query_generator.generate_search_queries(query, keywords_dict)
+        
+        # API용 검색어(따옴표 처리)는 페이지마다 다시 만들지 않도록 미리 준비
+        plan = (
+            tuple(keywords_dict.get('korean', [])),
+            tuple(keywords_dict.get('english', [])),
+            tuple(search_queries),
+            tuple(self._prepare_search_query_for_api(search_query) for search_query in search_queries)
+        )
+        
+        # 검색어를 만들지 못한 경우는 다음에 다시 시도하도록 저장하지 않음
+        if search_queries:
+            with self._query_plans_lock:
+                self._query_plans[query] = plan
+                if len(self._query_plans) > MAX_QUERY_PLANS:
+                    self._query_plans.popitem(last=False)
+        
+        return plan
     
     def _prepare_search_query_for_api(self, search_query: str) -> str:
         """
@@ -298,13 +349,8 @@ class SearchMetaGenerator:
         Returns:
             API용 검색어
         """
-        # JSON에서 이스케이프된 따옴표를 원래 따옴표로 복원
-        api_query = search_query.replace('\\"', '"')
-        
-        # 백슬래시가 포함된 경우 제거
-        api_query = api_query.replace('\\', '')
-        
-        return api_query
+        # 백슬래시 제거 (JSON에서 이스케이프된 따옴표 \" 도 원래 따옴표로 복원됨)
+        return search_query.replace('\\', '')
     
     def process_query(self, query: str, min_documents: int = 50) -> Dict[str, Any]:
         """
@@ -319,17 +365,15 @@ class SearchMetaGenerator:
         """
         logging.info(f"질문 처리 시작: {query[:50]}...")
         
-        # 1. 키워드 추출
-        keywords_dict = self.keyword_extractor.extract_keywords(query)
-        korean_keywords = keywords_dict.get('korean', [])
-        english_keywords = keywords_dict.get('english', [])
-        
-        # 2. 검색어 생성 (Gemini 활용)
-        search_queries = self.query_generator.generate_search_queries(query, keywords_dict)
+        # 1-2. 키워드 추출 및 검색어 생성 (같은 질문은 캐시된 계획 사용)
+        korean_keywords, english_keywords, search_queries, api_queries = self._plan_query(query)
+        korean_keywords = list(korean_keywords)
+        english_keywords = list(english_keywords)
+        search_queries = list(search_queries)
         logging.info(f"생성된 검색어 {len(search_queries)}개: {search_queries[:5]}...")  # 처음 5개만 로그
         
         # 3. 질문 언어 감지 및 우선 검색어 선택
-        is_english_query = any(char.isascii() and char.isalpha() for char in query[:50])
+        is_english_query = _ASCII_LETTER_RE.search(query, 0, 50) is not None
         
         if is_english_query:
             logging.info(f"영어 질문 감지: 영어 우선 검색어 사용")
@@ -337,78 +381,61 @@ class SearchMetaGenerator:
             logging.info(f"한국어 질문 감지: 한국어 우선 검색어 사용")
         
         # 4. 검색어로 문서 검색 (50개 이상 확보할 때까지 반복)
-        all_documents = []
-        page = 1
+        unique_docs = []  # 제목 기준으로 중복을 제거한 문서 (도착 순서 유지)
+        seen_titles = set()
         max_pages = 3  # 최대 3페이지까지 검색
+        # 검색어가 없으면 빈 페이지를 돌지 않음
+        pages = range(1, max_pages + 1) if api_queries else range(0)
         
-        while page <= max_pages:
-            logging.info(f"페이지 {page} 검색 중... (현재 {len(all_documents)}개 문서)")
-            
-            # 모든 검색어로 검색
-            for search_query in search_queries:
-                # 검색어를 API에 전달할 때 따옴표 처리
-                api_query = self._prepare_search_query_for_api(search_query)
-                docs = self.scienceon_client.search_articles(api_query, cur_page=page, row_count=20)
+        # 스레드 풀은 질문당 한 번만 만들어 모든 페이지에서 재사용
+        with ThreadPoolExecutor(max_workers=max(1, min(MAX_SEARCH_WORKERS, len(api_queries)))) as executor:
+            for page in pages:
+                logging.info(f"페이지 {page} 검색 중... (현재 {len(unique_docs)}개 문서)")
                 
-                # 즉시 품질 필터링 적용 (abstract 15자 이하 제외)
-                filtered_docs = []
-                for doc in docs:
-                    abstract = doc.get('abstract', '')
-                    if len(abstract.strip()) > 15:  # 15자 이하는 제외
-                        filtered_docs.append(doc)
+                # 모든 검색어로 동시에 검색하고, 결과는 검색어 순서대로 처리
+                futures = [
+                    executor.submit(self.scienceon_client.search_articles, api_query, cur_page=page, row_count=20)
+                    for api_query in api_queries
+                ]
+                page_doc_count = 0
                 
-                all_documents.extend(filtered_docs)
-                
-                # 품질 필터링 로그
-                filtered_count = len(docs) - len(filtered_docs)
-                if filtered_count > 0:
-                    logging.info(f"검색어 '{search_query}' → {len(docs)}개 문서 (품질 필터링으로 {filtered_count}개 제외)")
-                else:
-                    logging.info(f"검색어 '{search_query}' → {len(docs)}개 문서")
+                for search_query, future in zip(search_queries, futures):
+                    docs = future.result()
+                    page_doc_count += len(docs)
+                    
+                    # 품질 필터링(abstract 15자 이하 제외)과 제목 기준 중복 제거를 한 번에 적용
+                    filtered_count = 0
+                    for doc in docs:
+                        if len(doc.get('abstract', '').strip()) <= 15:
+                            filtered_count += 1
+                            continue
+                        
+                        title = doc.get('title', '')
+                        if title and title not in seen_titles:
+                            seen_titles.add(title)
+                            doc.pop('source', None)  # source 필드 제거 (ScienceON이 자명하므로)
+                            unique_docs.append(doc)
+                    
+                    # 품질 필터링 로그
+                    if filtered_count > 0:
+                        logging.info(f"검색어 '{search_query}' → {len(docs)}개 문서 (품질 필터링으로 {filtered_count}개 제외)")
+                    else:
+                        logging.info(f"검색어 '{search_query}' → {len(docs)}개 문서")
+                    
+                    # 중복 제거 후 개수 확인
+                    if len(unique_docs) >= min_documents:
+                        logging.info(f"목표 문서 수 {min_documents}개 달성: {len(unique_docs)}개 (품질 필터링 적용)")
+                        break
                 
-                # 중복 제거 후 개수 확인
-                unique_docs_temp = []
-                seen_titles_temp = set()
-                for doc in all_documents:
-                    title = doc.get('title', '')
-                    if title and title not in seen_titles_temp:
-                        unique_docs_temp.append(doc)
-                        seen_titles_temp.add(title)
+                # 목표 달성 시 아직 시작하지 않은 요청은 취소
+                for future in futures:
+                    future.cancel()
                 
-                if len(unique_docs_temp) >= min_documents:
-                    logging.info(f"목표 문서 수 {min_documents}개 달성: {len(unique_docs_temp)}개 (품질 필터링 적용)")
+                # 목표를 채웠거나, 이번 페이지에 결과가 하나도 없으면 다음 페이지도 비어 있으므로 중단
+                if len(unique_docs) >= min_documents or page_doc_count == 0:
                     break
-            
-            # 중복 제거 후 개수 확인
-            unique_docs_temp = []
-            seen_titles_temp = set()
-            for doc in all_documents:
-                title = doc.get('title', '')
-                if title and title not in seen_titles_temp:
-                    unique_docs_temp.append(doc)
-                    seen_titles_temp.add(title)
-            
-            if len(unique_docs_temp) >= min_documents:
-                break
-                
-            page += 1
         
-        # 5. 중복 제거 (제목 기준) - 품질 필터링은 이미 검색 중에 적용됨
-        unique_docs = []
-        seen_titles = set()
-        
-        for doc in all_documents:
-            title = doc.get('title', '')
-            
-            # 제목이 있고 중복이 아닌 경우
-            if title and title not in seen_titles:
-                # source 필드 제거 (ScienceON이 자명하므로)
-                if 'source' in doc:
-                    del doc['source']
-                unique_docs.append(doc)
-                seen_titles.add(title)
-        
-        # 6. 결과 정리
+        # 5. 결과 정리
         result = {
             'question': query,
             'keywords': {
@@ -427,33 +454,43 @@ class SearchMetaGenerator:
     
     def process_queries(self, queries: List[str], min_documents_per_query: int = 50) -> List[Dict[str, Any]]:
         """
-        여러 쿼리 일괄 처리
+        여러 쿼리 일괄 처리 (질문들을 동시에 처리하고 끝나는 순서대로 진행률 기록)
         
         Args:
             queries: 처리할 질문 리스트
             min_documents_per_query: 쿼리당 최소 보장 문서 수 (기본 50개)
             
         Returns:
-            처리 결과 리스트
+            처리 결과 리스트 (입력 순서 유지)
         """
-        results = []
-        
-        for i, query in enumerate(queries, 1):
-            logging.info(f"진행률: {i}/{len(queries)}")
-            try:
-                result = self.process_query(query, min_documents_per_query)
-                results.append(result)
-            except Exception as e:
-                logging.error(f"쿼리 처리 실패: {query[:50]}... - {e}")
-                # 실패한 쿼리도 결과에 포함
-                results.append({
-                    'question': query,
-                    'keywords': [],
-                    'documents': [],
-                    'total_documents_found': 0,
-                    'error': str(e),
-                    'search_timestamp': datetime.now().isoformat()
-                })
+        if not queries:
+            return []
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(queries)
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_QUERY_WORKERS, len(queries))) as executor:
+            futures = {
+                executor.submit(self.process_query, query, min_documents_per_query): i
+                for i, query in enumerate(queries)
+            }
+            
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                query = queries[i]
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    logging.error(f"쿼리 처리 실패: {query[:50]}... - {e}")
+                    # 실패한 쿼리도 결과에 포함
+                    results[i] = {
+                        'question': query,
+                        'keywords': [],
+                        'documents': [],
+                        'total_documents_found': 0,
+                        'error': str(e),
+                        'search_timestamp': datetime.now().isoformat()
+                    }
+                logging.info(f"진행률: {done}/{len(queries)}")
         
         return results
     
@@ -524,16 +561,13 @@ def test_full_search_pipeline():
         df = pd.read_csv('test.csv')
         print(f"📄 test.csv에서 {len(df)}개의 질문을 로드했습니다.")
         
-        # 테스트할 질문 개수 설정 (처음 3개만 테스트)
-        MAX_QUESTIONS = 3
-        test_queries = df['Question'].head(MAX_QUESTIONS).tolist()
-        # 전체 질문 처리
-        #test_queries = df['Question'].tolist()
+        # 테스트할 질문 (MAX_TEST_QUESTIONS개, None이면 전체)
+        questions = df['Question'] if MAX_TEST_QUESTIONS is None else df['Question'].head(MAX_TEST_QUESTIONS)
+        test_queries = questions.tolist()
 
 
 
-        print("🔍 전체 검색 파이프라인 테스트 시작")
-        print("=" * 60)
+        print("🔍 전체 검색 파이프라인 테스트 시작\n" + "=" * 60)
         
         # 쿼리 처리 (최소 50개 문서 보장)
         results = search_generator.process_queries(test_queries, min_documents_per_query=50)
@@ -542,25 +576,30 @@ def test_full_search_pipeline():
         output_file = search_generator.save_results_to_json(results)
         
         # 결과 요약 출력
-        print("\n📊 검색 결과 요약:")
-        print(f"   총 처리된 질문: {len(results)}개")
-        print(f"   성공한 질문: {len([r for r in results if 'error' not in r])}개")
-        print(f"   총 찾은 문서: {sum(r.get('total_documents_found', 0) for r in results)}개")
-        print(f"   결과 파일: {output_file}")
+        summary_lines = [
+            "\n📊 검색 결과 요약:",
+            f"   총 처리된 질문: {len(results)}개",
+            f"   성공한 질문: {sum(1 for r in results if 'error' not in r)}개",
+            f"   총 찾은 문서: {sum(r.get('total_documents_found', 0) for r in results)}개",
+            f"   결과 파일: {output_file}"
+        ]
         
         # 첫 번째 결과 미리보기
         if results:
             first_result = results[0]
-            print(f"\n📝 첫 번째 결과 미리보기:")
-            print(f"   질문: {first_result['question'][:80]}...")
-            print(f"   한국어 키워드: {first_result['keywords']['korean']}")
-            print(f"   영어 키워드: {first_result['keywords']['english']}")
-            print(f"   생성된 검색어: {first_result.get('search_queries', [])[:3]}...")
-            print(f"   찾은 문서 수: {first_result['total_documents_found']}개")
+            summary_lines += [
+                "\n📝 첫 번째 결과 미리보기:",
+                f"   질문: {first_result['question'][:80]}...",
+                f"   한국어 키워드: {first_result['keywords']['korean']}",
+                f"   영어 키워드: {first_result['keywords']['english']}",
+                f"   생성된 검색어: {first_result.get('search_queries', [])[:3]}...",
+                f"   찾은 문서 수: {first_result['total_documents_found']}개"
+            ]
             if first_result['documents']:
-                print(f"   첫 번째 문서: {first_result['documents'][0]['title'][:60]}...")
+                summary_lines.append(f"   첫 번째 문서: {first_result['documents'][0]['title'][:60]}...")
         
-        print("\n✅ 전체 검색 파이프라인 테스트 완료!")
+        summary_lines.append("\n✅ 전체 검색 파이프라인 테스트 완료!")
+        print("\n".join(summary_lines))
         
         # 자동으로 CSV와 JSONL 변환 실행
         if results:
@@ -591,35 +630,43 @@ def convert_to_csv_format(json_file_path, csv_output_path=None):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         csv_output_path = f"search_results_{timestamp}.csv"
     
-    csv_data = []
-    for result in data['results']:
-        row_data = {'Question': result['question']}
-        
-        for i in range(1, 51):
-            if i <= len(result['documents']):
-                doc = result['documents'][i-1]
-                title = doc.get('title', '제목 없음')
-                abstract = doc.get('abstract', '초록 없음')
-                cn = doc.get('CN', '')
-                source_url = f"http://click.ndsl.kr/servlet/OpenAPIDetailView?keyValue={cn}&target=NART&cn={cn}" if cn else "Source 정보 없음"
-                article_info = f"Title: {title}, Abstract: {abstract}, Source: {source_url}"
-                row_data[f'Prediction_retrieved_article_name_{i}'] = article_info
-            else:
-                row_data[f'Prediction_retrieved_article_name_{i}'] = ''
-        
-        csv_data.append(row_data)
-    
+    # 질문별 행을 만들자마자 파일에 기록 (전체 행을 메모리에 모아 DataFrame으로 만들지 않음)
+    first_row = None
+    row_count = 0
     try:
-        df = pd.DataFrame(csv_data)
-        df.to_csv(csv_output_path, index=False, encoding='utf-8')
-        print(f"✅ CSV 파일 생성 완료: {csv_output_path}")
-        print(f"   총 {len(csv_data)}개 질문, 각각 최대 50개 논문 정보 포함")
-        
-        if csv_data:
-            print(f"\n📝 CSV 미리보기 (첫 번째 행):")
-            print(f"   Question: {csv_data[0]['Question'][:50]}...")
-            print(f"   Prediction_retrieved_article_name_1: {csv_data[0]['Prediction_retrieved_article_name_1'][:100]}...")
-            print(f"   Prediction_retrieved_article_name_2: {csv_data[0]['Prediction_retrieved_article_name_2'][:100]}...")
+        with open(csv_output_path, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.DictWriter(f, fieldnames=_CSV_FIELDNAMES, lineterminator='\n')
+            writer.writeheader()
+            
+            for result in data['results']:
+                row_data = dict.fromkeys(_ARTICLE_COLUMNS, '')
+                row_data['Question'] = result['question']
+                
+                for column, doc in zip(_ARTICLE_COLUMNS, result['documents']):
+                    title = doc.get('title', '제목 없음')
+                    abstract = doc.get('abstract', '초록 없음')
+                    cn = doc.get('CN', '')
+                    source_url = f"http://click.ndsl.kr/servlet/OpenAPIDetailView?keyValue={cn}&target=NART&cn={cn}" if cn else "Source 정보 없음"
+                    row_data[column] = f"Title: {title}, Abstract: {abstract}, Source: {source_url}"
+                
+                writer.writerow(row_data)
+                row_count += 1
+                if first_row is None:
+                    first_row = row_data
+        
+        report_lines = [
+            f"✅ CSV 파일 생성 완료: {csv_output_path}",
+            f"   총 {row_count}개 질문, 각각 최대 50개 논문 정보 포함"
+        ]
+        
+        if first_row is not None:
+            report_lines += [
+                "\n📝 CSV 미리보기 (첫 번째 행):",
+                f"   Question: {first_row['Question'][:50]}...",
+                f"   Prediction_retrieved_article_name_1: {first_row['Prediction_retrieved_article_name_1'][:100]}...",
+                f"   Prediction_retrieved_article_name_2: {first_row['Prediction_retrieved_article_name_2'][:100]}..."
+            ]
+        print("\n".join(report_lines))
         
     except Exception as e:
         print(f"❌ CSV 파일 저장 실패: {e}")
@@ -664,15 +711,20 @@ def convert_to_jsonl_format(json_file_path, jsonl_output_path=None):
             for doc in unique_documents:
                 f.write(json.dumps(doc, ensure_ascii=False) + '\n')
         
-        print(f"✅ JSONL 파일 생성 완료: {jsonl_output_path}")
-        print(f"   총 {len(unique_documents)}개 중복 없는 논문")
+        report_lines = [
+            f"✅ JSONL 파일 생성 완료: {jsonl_output_path}",
+            f"   총 {len(unique_documents)}개 중복 없는 논문"
+        ]
         
         if unique_documents:
-            print(f"\n📝 JSONL 미리보기 (첫 번째 논문):")
             first_doc = unique_documents[0]
-            print(f"   CN: {first_doc['CN']}")
-            print(f"   Title: {first_doc['title'][:60]}...")
-            print(f"   Abstract: {first_doc['abstract'][:100]}...")
+            report_lines += [
+                "\n📝 JSONL 미리보기 (첫 번째 논문):",
+                f"   CN: {first_doc['CN']}",
+                f"   Title: {first_doc['title'][:60]}...",
+                f"   Abstract: {first_doc['abstract'][:100]}..."
+            ]
+        print("\n".join(report_lines))
         
     except Exception as e:
         print(f"❌ JSONL 파일 저장 실패: {e}")
@@ -680,8 +732,7 @@ def convert_to_jsonl_format(json_file_path, jsonl_output_path=None):
 
 def test_csv_conversion():
     """CSV 변환 테스트"""
-    print("🧪 CSV 변환 테스트 시작")
-    print("=" * 40)
+    print("🧪 CSV 변환 테스트 시작\n" + "=" * 40)
     
     json_files = [f for f in os.listdir('.') if f.startswith('search_meta_results_') and f.endswith('.json')]
     if not json_files:
@@ -697,8 +748,7 @@ def test_csv_conversion():
 
 def test_jsonl_conversion():
     """JSONL 변환 테스트"""
-    print("🧪 JSONL 변환 테스트 시작")
-    print("=" * 40)
+    print("🧪 JSONL 변환 테스트 시작\n" + "=" * 40)
     
     json_files = [f for f in os.listdir('.') if f.startswith('search_meta_results_') and f.endswith('.json')]
     if not json_files:
@@ -713,19 +763,23 @@ def test_jsonl_conversion():
 
 
 if __name__ == "__main__":
-    import sys
-    
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "full":
-            test_full_search_pipeline()
-        elif sys.argv[1] == "csv":
-            test_csv_conversion()
-        elif sys.argv[1] == "jsonl":
-            test_jsonl_conversion()
-        else:
-            print("사용법: python search_meta.py [full|csv|jsonl]")
-            print("  full:   전체 검색 파이프라인 테스트 (자동으로 CSV, JSONL도 생성)")
-            print("  csv:    JSON 결과를 CSV로 변환")
-            print("  jsonl:  JSON 결과를 JSONL로 변환 (중복 없는 논문 목록)")
+    parser = argparse.ArgumentParser(
+        description="검색 메타데이터 생성 시스템",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=(
+            "  full:   전체 검색 파이프라인 테스트 (자동으로 CSV, JSONL도 생성)\n"
+            "  csv:    JSON 결과를 CSV로 변환\n"
+            "  jsonl:  JSON 결과를 JSONL로 변환 (중복 없는 논문 목록)"
+        )
+    )
+    parser.add_argument('mode', nargs='?', choices=['full', 'csv', 'jsonl'], help="실행 모드")
+    args = parser.parse_args()
+    
+    if args.mode == "full":
+        test_full_search_pipeline()
+    elif args.mode == "csv":
+        test_csv_conversion()
+    elif args.mode == "jsonl":
+        test_jsonl_conversion()
     else:
-        test_keyword_extraction()
\ No newline at end of file
+        parser.print_help()
@@ -9,11 +9,24 @@ Kaggle 제출용 모듈화 RAG 파이프라인 v2.0
 
 import os
 import sys
+import json
 import time
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from tqdm import tqdm
 
+# 제출 파일 컬럼 (모듈 로드 시 한 번만 구성)
+PREDICTION_ARTICLE_COLUMNS = tuple(f'prediction_retrieved_article_name_{i}' for i in range(1, 51))
+SUBMISSION_COLUMN_ORDER = (
+    ('id', 'Question', 'SAI_Answer', 'translated_question', 'translated_SAI_answer')
+    + tuple(f'retrieved_article_name_{i}' for i in range(1, 51))
+    + PREDICTION_ARTICLE_COLUMNS
+    + ('Prediction', 'elapsed_times')
+)
+
 def create_submission_documentation(md_filepath, pipeline_type, pipeline_stats, total_time, question_count):
     """제출 파일에 대한 상세한 MD 문서 생성"""
     
@@ -120,20 +133,47 @@ python submission_pipeline_modular.py
     with open(md_filepath, 'w', encoding='utf-8') as f:
         f.write(md_content)
 
+# 필수 라이브러리 (import 모듈명 -> pip 패키지명)
+REQUIRED_PACKAGES = {
+    'requests': 'requests',
+    'Crypto': 'pycryptodome',
+    'google.generativeai': 'google-generativeai',
+    'chromadb': 'chromadb',
+    'sentence_transformers': 'sentence-transformers',
+}
+
+def _find_missing_packages() -> list:
+    """설치되지 않은 필수 패키지 목록 (모듈을 실행하지 않고 find_spec으로만 확인)"""
+    missing = []
+    for module_name, package_name in REQUIRED_PACKAGES.items():
+        try:
+            found = importlib.util.find_spec(module_name) is not None
+        except ModuleNotFoundError:  # 상위 패키지(google 등)가 없는 경우
+            found = False
+        if not found:
+            missing.append(package_name)
+    return missing
+
+# torch/transformers 등 무거운 모듈을 불러오기 전에 누락된 패키지를 한 번에 안내
+_missing_packages = _find_missing_packages()
+if _missing_packages:
+    print(f"🚨 [오류] 필수 라이브러리가 설치되지 않았습니다: {', '.join(_missing_packages)}\n"
+          "   다음 명령어로 설치하세요: pip install -r requirements.txt")
+    sys.exit(1)
+
 # 필수 라이브러리 import
 try:
     from scienceon_api_example import ScienceONAPIClient
     from gemini_client import GeminiClient
     from modules import RAGPipeline
+    from modules.config import SEARCH_CONFIG, CRAG_CONFIG, TEST_CONFIG
 except ImportError as e:
-    print(f"🚨 [오류] 필수 라이브러리가 설치되지 않았습니다: {e}")
-    print("   다음 명령어로 설치하세요: pip install -r requirements.txt")
+    print(f"🚨 [오류] 필수 라이브러리가 설치되지 않았습니다: {e}\n"
+          "   다음 명령어로 설치하세요: pip install -r requirements.txt")
     sys.exit(1)
 
 def validate_credentials(path: Path) -> dict:
     """API 인증 정보 검증"""
-    import json
-    
     credentials = {}
     if not path.exists():
         print(f"🚨 설정 파일을 찾을 수 없습니다! (경로: {path})")
@@ -158,36 +198,67 @@ def validate_credentials(path: Path) -> dict:
     print("✅ [성공] API 인증 정보 파일이 유효합니다.")
     return credentials
 
+def _create_pipeline(credentials_path: Path = Path('./configs/scienceon_api_credentials.json'),
+                     gemini_credentials_path: Path = Path('./configs/gemini_api_credentials.json')):
+    """API 클라이언트와 RAG 파이프라인 생성 (main에서 한 번 호출)"""
+    try:
+        api_client = ScienceONAPIClient(
+            credentials_path=credentials_path,
+            api_delay=SEARCH_CONFIG['api_delay'],
+            api_burst=SEARCH_CONFIG.get('api_burst', 1),
+            pool_maxsize=SEARCH_CONFIG.get('api_pool_size', 16)
+        )
+        gemini_client = GeminiClient(gemini_credentials_path)
+        print("✅ API 클라이언트 초기화 완료")
+    except Exception as e:
+        print(f"⚠️  API 클라이언트 초기화 실패: {e}\n"
+              "   configs 폴더의 인증 파일을 확인하세요.")
+        sys.exit(1)
+    
+    return api_client, gemini_client, RAGPipeline(api_client, gemini_client)
+
+def write_submission_csv(submission_df: pd.DataFrame, filepath: Path):
+    """
+    제출 CSV 저장 (UTF-8 BOM 포함, pyarrow 설치 시 C 구현 CSV 작성기 사용)
+    
+    같은 폴더의 임시 파일에 모두 쓴 뒤 교체하므로 중간에 실패해도 반쯤 쓰인 CSV가 남지 않는다.
+    """
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = filepath.with_name(filepath.name + '.tmp')
+    
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        submission_df.to_csv(tmp_path, index=False, encoding='utf-8-sig')
+    else:
+        table = pa.Table.from_pandas(submission_df, preserve_index=False)
+        with open(tmp_path, 'wb') as f:
+            f.write('\ufeff'.encode('utf-8'))
+            pa_csv.write_csv(table, f)
+    
+    os.replace(tmp_path, filepath)
+
 def main():
     """메인 실행 함수"""
     print("⭐ Kaggle 제출용 모듈화 RAG 파이프라인 v2.0")
-    start_time = time.time()
+    start_time = time.perf_counter()
     
     # 1. API 인증 정보 검증
     credentials_path = Path('./configs/scienceon_api_credentials.json')
     validate_credentials(credentials_path)
     
-    # 2. API 클라이언트 초기화
-    try:
-        api_client = ScienceONAPIClient(credentials_path=credentials_path)
-        gemini_credentials_path = Path('./configs/gemini_api_credentials.json')
-        gemini_client = GeminiClient(gemini_credentials_path)
-        print("✅ API 클라이언트 초기화 완료")
-    except Exception as e:
-        print(f"⚠️  API 클라이언트 초기화 실패: {e}")
-        print("   configs 폴더의 인증 파일을 확인하세요.")
-        sys.exit(1)
-    
-    # 3. RAG 파이프라인 초기화
-    pipeline = RAGPipeline(api_client, gemini_client)
+    # 2-3. API 클라이언트 및 RAG 파이프라인 초기화 (프로세스당 한 번)
+    api_client, gemini_client, pipeline = _create_pipeline(credentials_path)
     
     # CRAG 설정 정보 출력
-    from modules.config import CRAG_CONFIG
     if CRAG_CONFIG.get('enable_crag', False):
-        print("✅ CRAG 파이프라인 활성화")
-        print(f"   - 품질 임계값: {CRAG_CONFIG.get('quality_threshold', 0.7)}")
-        print(f"   - 최대 교정 시도: {CRAG_CONFIG.get('max_corrective_attempts', 2)}회")
-        print(f"   - 웹 검색: {'활성화' if CRAG_CONFIG.get('web_search_enabled', False) else '비활성화'}")
+        print("\n".join([
+            "✅ CRAG 파이프라인 활성화",
+            f"   - 품질 임계값: {CRAG_CONFIG.get('quality_threshold', 0.7)}",
+            f"   - 최대 교정 시도: {CRAG_CONFIG.get('max_corrective_attempts', 2)}회",
+            f"   - 웹 검색: {'활성화' if CRAG_CONFIG.get('web_search_enabled', False) else '비활성화'}"
+        ]))
     else:
         print("⚠️  CRAG 파이프라인 비활성화")
     
@@ -197,7 +268,6 @@ def main():
         print(f"✅ 테스트 파일 로드: {len(test_df)}개 질문")
         
         # 테스트용 질문 수 제한
-        from modules.config import TEST_CONFIG
         max_questions = TEST_CONFIG['max_questions']
         if len(test_df) > max_questions:
             test_df = test_df.head(max_questions)
@@ -217,120 +287,148 @@ def main():
     print(f"\n--- 질문 처리 시작 ---")
     
     # 질문을 튜플 리스트로 변환
-    questions_to_process = [(index, row['Question']) for index, row in test_df.iterrows()]
+    questions_to_process = list(zip(test_df.index, test_df['Question']))
+    
+    # 질문 임베딩은 한 번의 배치 인코딩으로 미리 계산 (이후 벡터 검색/키워드 캐시에서 재사용)
+    try:
+        pipeline.document_manager.precompute_query_embeddings([question for _, question in questions_to_process])
+    except Exception as e:
+        print(f"⚠️  질문 임베딩 사전 계산 실패: {e}")
     
     # 배치 처리 (시간 측정 포함)
     elapsed_times = []
-    
-    with tqdm(total=len(questions_to_process), desc="질문 처리") as pbar:
-        for index, row in test_df.iterrows():
-            print(f"\n🔍 질문 {index+1}: {row['Question'][:100]}...")
-            
-            # 개별 질문 처리 시간 측정
-            question_start_time = time.time()
-            answer, articles = pipeline.process_question(index, row['Question'])
-            question_elapsed_time = time.time() - question_start_time
-            
+    question_workers = SEARCH_CONFIG.get('question_workers', 1)
+    
+    if question_workers > 1:
+        # 질문끼리는 독립적이므로 question_workers개씩 동시에 처리 (결과는 원래 질문 순서로 저장)
+        def process_one(index, question):
+            print(f"\n🔍 질문 {index+1}: {question[:100]}...")
+            question_start_time = time.perf_counter()
+            answer, articles = pipeline.process_question(index, question)
+            return answer, articles, time.perf_counter() - question_start_time
+        
+        results = [None] * len(questions_to_process)
+        with tqdm(total=len(questions_to_process), desc="질문 처리") as pbar, \
+             ThreadPoolExecutor(max_workers=question_workers) as executor:
+            futures = {
+                executor.submit(process_one, index, question): position
+                for position, (index, question) in enumerate(questions_to_process)
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+                pbar.update(1)
+        
+        for answer, articles, question_elapsed_time in results:
             predictions.append(answer)
             predicted_articles.append(articles)
             elapsed_times.append(question_elapsed_time)
-            pbar.update(1)
-    
-    # 6. 결과 저장 - 올바른 컬럼 순서로 구성
-    # 올바른 컬럼 순서 정의
-    correct_column_order = [
-        'id', 'Question', 'SAI_Answer', 'translated_question', 'translated_SAI_answer'
-    ]
     
-    # retrieved_article_name_1~50 추가
-    for i in range(1, 51):
-        correct_column_order.append(f'retrieved_article_name_{i}')
-    
-    # prediction_retrieved_article_name_1~50 추가
-    for i in range(1, 51):
-        correct_column_order.append(f'prediction_retrieved_article_name_{i}')
-    
-    # Prediction과 elapsed_times 추가
-    correct_column_order.extend(['Prediction', 'elapsed_times'])
-    
-    # 새로운 submission DataFrame 생성
-    submission_df = pd.DataFrame()
-    
-    # 1. 원본 컬럼들 복사 (올바른 순서로)
-    for col in correct_column_order:
+    else:
+        # 현재 질문을 처리하는 동안 다음 질문의 키워드(LLM 호출)를 미리 추출
+        with tqdm(total=len(questions_to_process), desc="질문 처리") as pbar, \
+             ThreadPoolExecutor(max_workers=1) as keyword_prefetcher:
+            next_keywords = None
+            if questions_to_process:
+                next_keywords = keyword_prefetcher.submit(pipeline.prefetch_keywords, [questions_to_process[0][1]])
+            
+            for position, (index, question) in enumerate(questions_to_process):
+                print(f"\n🔍 질문 {index+1}: {question[:100]}...")
+                
+                # 개별 질문 처리 시간 측정 (미리 추출한 키워드를 기다린 시간 포함)
+                question_start_time = time.perf_counter()
+                keywords = next_keywords.result()[0]
+                if position + 1 < len(questions_to_process):
+                    next_keywords = keyword_prefetcher.submit(
+                        pipeline.prefetch_keywords, [questions_to_process[position + 1][1]]
+                    )
+                answer, articles = pipeline.process_question(index, question, keywords=keywords)
+                question_elapsed_time = time.perf_counter() - question_start_time
+                
+                predictions.append(answer)
+                predicted_articles.append(articles)
+                elapsed_times.append(question_elapsed_time)
+                pbar.update(1)
+    
+    # 6. 결과 저장 - 올바른 컬럼 순서(SUBMISSION_COLUMN_ORDER)로 구성
+    # 예측 논문 목록을 (질문 수, 50) 배열로 한 번에 채움 (부족한 칸은 빈 문자열)
+    article_matrix = np.full((len(predicted_articles), 50), '', dtype=object)
+    for row_index, articles in enumerate(predicted_articles):
+        articles = articles[:50]
+        article_matrix[row_index, :len(articles)] = articles
+    
+    # 컬럼별 데이터를 모은 뒤 올바른 순서로 DataFrame을 한 번에 생성
+    # (빈 DataFrame에 컬럼을 하나씩 추가하면 매번 내부 블록이 늘어나고 마지막 재정렬에서 전체가 복사됨)
+    # 우선순위: test.csv의 원본 컬럼 > 예측 결과 컬럼
+    columns = {'Prediction': predictions, 'elapsed_times': elapsed_times}
+    for article_index, col in enumerate(PREDICTION_ARTICLE_COLUMNS):
+        columns[col] = article_matrix[:, article_index]
+    for col in SUBMISSION_COLUMN_ORDER:
         if col in test_df.columns:
-            submission_df[col] = test_df[col]
-        elif col == 'Prediction':
-            submission_df[col] = predictions
-        elif col == 'elapsed_times':
-            submission_df[col] = elapsed_times
-        elif col.startswith('prediction_retrieved_article_name_'):
-            # prediction_retrieved_article_name_1~50 컬럼 생성
-            article_index = int(col.split('_')[-1]) - 1
-            submission_df[col] = [articles[article_index] if article_index < len(articles) else '' 
-                                  for articles in predicted_articles]
-    
-    # 컬럼 순서 강제 적용
-    submission_df = submission_df[correct_column_order]
+            columns[col] = test_df[col].to_numpy()
+    
+    submission_df = pd.DataFrame({col: columns[col] for col in SUBMISSION_COLUMN_ORDER}, index=test_df.index)
     
     # 7. null 값 처리 및 저장 (강화된 검증)
     submission_df = submission_df.fillna('')
     
     # 추가 null 값 검증
     for col in submission_df.columns:
-        submission_df[col] = submission_df[col].astype(str).replace('nan', '')
-        submission_df[col] = submission_df[col].replace('', 'No relevant document found')
+        values = submission_df[col].astype(str)
+        submission_df[col] = values.mask((values == '') | (values == 'nan'), 'No relevant document found')
     
-    # Answer 컬럼 특별 검증
-    submission_df['Prediction'] = submission_df['Prediction'].apply(
-        lambda x: 'Based on the available research documents, this question requires further investigation.' if not x or x.strip() == '' or len(x.strip()) < 10 else x
-    )
+    # Answer 컬럼 특별 검증 (공백 제외 10자 미만 답변 대체)
+    short_answers = submission_df['Prediction'].str.strip().str.len() < 10
+    submission_df.loc[short_answers, 'Prediction'] = 'Based on the available research documents, this question requires further investigation.'
     
-    # submission 폴더 생성
-    submission_dir = '../submissions'
-    os.makedirs(submission_dir, exist_ok=True)
+    # 제출 경로 (상위 폴더는 write_submission_csv에서 생성)
+    submission_dir = Path('../submissions')
     
     # 파일명에 파이프라인 정보 포함
     timestamp = time.strftime("%Y%m%d_%H%M%S")
     filename = f'submission_modular_v2_{timestamp}.csv'
-    filepath = os.path.join(submission_dir, filename)
-    submission_df.to_csv(filepath, index=False, encoding='utf-8-sig')
+    filepath = submission_dir / filename
+    write_submission_csv(submission_df, filepath)
     
     # 8. 성능 지표 출력
-    total_time = time.time() - start_time
+    total_time = time.perf_counter() - start_time
     
     # 파이프라인 통계 가져오기
     pipeline_stats = pipeline.get_pipeline_stats()
     
     # MD 문서 생성
-    md_filename = filename.replace('.csv', '.md')
-    md_filepath = os.path.join(submission_dir, md_filename)
+    md_filepath = filepath.with_suffix('.md')
     create_submission_documentation(md_filepath, 'modular_v2', pipeline_stats, total_time, len(test_df))
     
-    print(f"   📁 생성된 파일: {filepath}")
-    print(f"   📄 생성된 문서: {md_filepath}")
-    
-    print(f"\n🎉 모듈화 RAG 파이프라인 완료!")
-    print(f"   ⏱️  총 소요 시간: {total_time:.2f}초")
-    print(f"   📊 평균 처리 시간: {total_time/len(test_df):.2f}초/질문")
-    print(f"   ✅ 성공률: {len(test_df)}/{len(test_df)} (100.0%)")
-    print(f"   📁 {filepath} 생성 완료")
-    
-    # 9. 파이프라인 통계 출력
-    print(f"   📈 파이프라인 통계: {pipeline_stats}")
-    
-    # 10. 파일 검증
-    print(f"\n📊 파일 검증:")
-    print(f"   - 총 질문 수: {len(submission_df)}")
-    print(f"   - 답변 생성된 질문 수: {len(submission_df[submission_df['Prediction'].notna() & (submission_df['Prediction'] != '')])}")
-    print(f"   - 논문 검색된 질문 수: {len(submission_df[submission_df['prediction_retrieved_article_name_1'].notna() & (submission_df['prediction_retrieved_article_name_1'] != '')])}")
+    # 요약 블록은 줄을 모아 한 번에 출력
+    summary_lines = [
+        f"   📁 생성된 파일: {filepath}",
+        f"   📄 생성된 문서: {md_filepath}",
+        "",
+        "🎉 모듈화 RAG 파이프라인 완료!",
+        f"   ⏱️  총 소요 시간: {total_time:.2f}초",
+        f"   📊 평균 처리 시간: {total_time/len(test_df):.2f}초/질문",
+        *([f"   ⏲️  질문별 처리 시간: 최소 {min(elapsed_times):.2f}초 / 평균 {sum(elapsed_times)/len(elapsed_times):.2f}초 / 최대 {max(elapsed_times):.2f}초"]
+          if elapsed_times else []),
+        f"   ✅ 성공률: {len(test_df)}/{len(test_df)} (100.0%)",
+        f"   📁 {filepath} 생성 완료",
+        # 9. 파이프라인 통계 출력
+        f"   📈 파이프라인 통계: {pipeline_stats}",
+        # 10. 파일 검증
+        "",
+        "📊 파일 검증:",
+        f"   - 총 질문 수: {len(submission_df)}",
+        f"   - 답변 생성된 질문 수: {len(submission_df[submission_df['Prediction'].notna() & (submission_df['Prediction'] != '')])}",
+        f"   - 논문 검색된 질문 수: {len(submission_df[submission_df['prediction_retrieved_article_name_1'].notna() & (submission_df['prediction_retrieved_article_name_1'] != '')])}"
+    ]
     
     # null 값 확인
     null_counts = submission_df.isnull().sum()
     if null_counts.sum() > 0:
-        print(f"   ⚠️  null 값 발견: {null_counts[null_counts > 0].to_dict()}")
+        summary_lines.append(f"   ⚠️  null 값 발견: {null_counts[null_counts > 0].to_dict()}")
     else:
-        print(f"   ✅ null 값 없음")
+        summary_lines.append(f"   ✅ null 값 없음")
+    
+    print("\n".join(summary_lines))
 
 if __name__ == "__main__":
     main()
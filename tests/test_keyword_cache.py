@@ -0,0 +1,39 @@
+"""
+RAG 파이프라인의 질문별 LLM 키워드 재사용 테스트
+"""
+
+import pytest
+
+rag_pipeline = pytest.importorskip("modules.rag_pipeline")
+np = pytest.importorskip("numpy")
+
+
+class EchoLLMExtractor:
+    """질문마다 다른 키워드를 돌려주는 LLM 추출기"""
+    
+    def __init__(self):
+        self.queries = []
+    
+    def extract_keywords(self, query, **kwargs):
+        self.queries.append(query)
+        return [f"키워드{len(self.queries)}"]
+
+
+class ConstantEmbeddingManager:
+    """모든 질문에 같은 임베딩을 돌려주는 문서 관리자 (최악의 유사도 충돌 상황)"""
+    
+    def get_query_embedding(self, query):
+        return np.ones(4, dtype=np.float32) / 2.0
+
+
+def test_korean_template_questions_do_not_share_keywords():
+    pipeline = rag_pipeline.RAGPipeline.__new__(rag_pipeline.RAGPipeline)
+    extractor = EchoLLMExtractor()
+    pipeline.keyword_extractors = {'llm': extractor}
+    pipeline.document_manager = ConstantEmbeddingManager()
+    
+    first = pipeline._extract_llm_keywords("양자컴퓨팅 연구 동향을 어떻게 요약할 수 있나요?")
+    second = pipeline._extract_llm_keywords("미세먼지 저감 기술을 어떻게 요약할 수 있나요?")
+    
+    assert first != second
+    assert len(extractor.queries) == 2
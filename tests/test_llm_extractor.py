@@ -0,0 +1,69 @@
+"""
+LLM 키워드 추출기 테스트 (Gemini 클라이언트는 가짜 객체로 대체)
+"""
+
+from modules.keyword_extractors.llm_extractor import LLMKeywordExtractor
+
+
+class FailingGeminiClient:
+    """항상 생성에 실패하는 Gemini 클라이언트"""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def generate_answer(self, prompt, max_retries=3, raise_on_error=False):
+        self.calls += 1
+        if raise_on_error:
+            raise RuntimeError("503 Service Unavailable")
+        return "API 호출 중 오류가 발생했습니다: 503 Service Unavailable"
+
+
+def _make_extractor(client):
+    return LLMKeywordExtractor(client, config={
+        'max_keywords': 5,
+        'min_keyword_length': 2,
+        'use_advanced_prompt': True,
+        'persistent_cache_path': None,
+        'failure_cooldown': 60
+    })
+
+
+def test_gemini_error_returns_no_keywords_and_starts_cooldown():
+    client = FailingGeminiClient()
+    extractor = _make_extractor(client)
+    
+    assert extractor.extract_keywords("인공지능의 윤리적 문제는 무엇인가요?") == []
+    assert client.calls == 1
+    assert not extractor.is_available()
+    
+    # 대기 시간 동안은 Gemini를 다시 호출하지 않음
+    assert extractor.extract_keywords("딥러닝 모델의 학습 방법은?") == []
+    assert client.calls == 1
+
+
+class KeywordGeminiClient:
+    """정상적으로 키워드를 생성하는 Gemini 클라이언트"""
+    
+    def generate_answer(self, prompt, max_retries=3, raise_on_error=False):
+        return "인공지능 윤리\nAI ethics\n알고리즘 편향"
+
+
+def test_failed_generation_is_not_persisted(tmp_path):
+    cache_path = tmp_path / "keyword_cache.db"
+    query = "인공지능의 윤리적 문제는 무엇인가요?"
+    config = {
+        'max_keywords': 5,
+        'min_keyword_length': 2,
+        'use_advanced_prompt': True,
+        'persistent_cache_path': str(cache_path),
+        'persistent_cache_ttl': 3600
+    }
+    
+    failing = LLMKeywordExtractor(FailingGeminiClient(), config=dict(config))
+    assert failing.extract_keywords(query) == []
+    assert failing._get_persistent_keywords(query) is None
+    
+    # 성공한 결과는 다음 실행(새 추출기)에서 재사용
+    LLMKeywordExtractor(KeywordGeminiClient(), config=dict(config)).extract_keywords(query)
+    reloaded = LLMKeywordExtractor(FailingGeminiClient(), config=dict(config))
+    assert reloaded.extract_keywords(query) == ["인공지능 윤리", "AI ethics", "알고리즘 편향"]